@@ -0,0 +1,189 @@
+""" Memory instrumentation for identifier and term populations.
+
+    report() counts the live OntId, OntTerm and QueryResult instances
+    and reports the sizes of the caches that are held at class level.
+    Instances are found by walking the objects tracked by the garbage
+    collector so there is no cost until a report is requested, however
+    a report is proportional to the size of the heap, don't call it in
+    a hot loop.
+
+    Sizes are approximate, they are computed with sys.getsizeof and
+    only count memory that is owned by the instance or cache, strings
+    and other objects that are shared between entries are counted once.
+
+    For allocation level detail use start(), snapshot(), and diff()
+    which wrap tracemalloc and filter the traces down to ontquery. """
+
+import gc
+import os
+import sys
+import tracemalloc
+from . import utils
+from .trie import NamespaceIndex
+from .terms import Id, Identifier, FrozenCuries, OntCuries, OntId, OntTerm
+from .utils import QueryResult, MemoCache, LRUCache
+
+_package_dir = os.path.dirname(os.path.abspath(__file__))
+# only the attributes of these are counted, anything else that is
+# referenced, e.g. a service or an rdflib graph, only counts itself
+_owners = Id, QueryResult, MemoCache, LRUCache, FrozenCuries, NamespaceIndex
+
+
+def sizeof(obj, seen=None):
+    """ approximate size in bytes of obj and everything it owns,
+        objects whose id is in seen are skipped, seen is updated """
+    if seen is None:
+        seen = set()
+
+    size = 0
+    stack = [obj]
+    while stack:
+        o = stack.pop()
+        i = id(o)
+        if i in seen or isinstance(o, type):
+            continue
+
+        seen.add(i)
+        size += sys.getsizeof(o)
+        if isinstance(o, dict):
+            stack.extend(o.keys())
+            stack.extend(o.values())
+        elif isinstance(o, (list, tuple, set, frozenset)):
+            stack.extend(o)
+
+        if not isinstance(o, _owners):
+            continue
+
+        d = getattr(o, '__dict__', None)
+        if isinstance(d, dict):  # not a mappingproxy
+            stack.append(d)
+
+        for klass in type(o).__mro__:
+            for slot in klass.__dict__.get('__slots__', ()):
+                if slot in ('__dict__', '__weakref__'):
+                    continue
+
+                if slot.startswith('__') and not slot.endswith('__'):
+                    slot = f'_{klass.__name__.lstrip("_")}{slot}'
+
+                try:
+                    stack.append(getattr(o, slot))
+                except AttributeError:
+                    pass
+
+    return size
+
+
+def instances():
+    """ live instances as a dict of population name -> list,
+        OntTerms are not included in OntId """
+    out = {'OntId': [], 'QueryResult': [], 'OntTerm': []}
+    for o in gc.get_objects():
+        if isinstance(o, OntTerm):
+            out['OntTerm'].append(o)
+        elif isinstance(o, OntId):
+            out['OntId'].append(o)
+        elif isinstance(o, QueryResult):
+            out['QueryResult'].append(o)
+
+    return out
+
+
+def _population(objects, seen):
+    return {'count': len(objects),
+            'bytes': sum(sizeof(o, seen) for o in objects)}
+
+
+def _cache(cache, seen):
+    return {'entries': len(cache), 'bytes': sizeof(cache, seen)}
+
+
+def _graph_cache():
+    # only report if interlex is already in use, importing
+    # it here would pull in requests and the api client
+    module = sys.modules.get('ontquery.plugins.services.interlex')
+    if module is None:
+        return None
+
+    cache = module._InterLexSharedCache._graph_cache
+    # rdflib graphs are not sized, their store is opaque to getsizeof
+    return {'entries': len(cache),
+            'bytes': sys.getsizeof(cache),
+            'triples': sum(len(g) for g in list(cache.values()) if g is not None)}
+
+
+def _curies(seen):
+    snapshot = OntCuries._snapshot if hasattr(OntCuries, '_snapshot') else OntCuries.freeze()
+    memo = snapshot._memo
+    derived = {str(getattr(k, '__name__', k)):
+               {'entries': len(v), 'bytes': sizeof(v.memo, seen)}
+               if isinstance(v, MemoCache) else
+               {'entries': len(v), 'bytes': sizeof(v, seen)}
+               for k, v in list(memo.derived.items())}
+    return {'prefixes': len(snapshot),
+            'bytes': sizeof((snapshot._dict, snapshot._n_to_p, snapshot._trie), seen),
+            'qname_memo': _cache(memo.memo, seen),
+            'derived': derived}
+
+
+def report(instances_=None):
+    """ live instance counts and sizes, and class level cache sizes
+
+        each object is counted once, caches are sized first so that
+        a result in OntTerm._cache is attributed to the cache, then
+        OntId, QueryResult, and OntTerm, so a QueryResult that an
+        OntTerm reads through to is never counted as the OntTerm """
+    seen = set()
+    interned = {c.__name__: _cache(c.__dict__['_intern_table'][1], seen)
+                for c in _subclasses(OntId) if '_intern_table' in c.__dict__}
+    caches = {
+        'OntTerm._cache': _cache(OntTerm._cache, seen),
+        '_InterLexSharedCache._graph_cache': _graph_cache(),
+        'OntCuries': _curies(seen),
+        'OntId._interned': interned,
+        'OntId._repr_templates': _cache(OntId._repr_templates, seen),
+        'Identifier._class_cache': {'entries': len(Identifier._class_cache),
+                                    'bytes': sys.getsizeof(Identifier._class_cache)},
+        '_already_logged': _cache(vars(utils)['__logged'], seen),
+    }
+    if instances_ is None:
+        instances_ = instances()
+
+    populations = {name: _population(objects, seen)
+                   for name, objects in instances_.items()}
+    return {'instances': populations, 'caches': caches}
+
+
+def _subclasses(cls):
+    yield cls
+    yield from utils.subclasses(cls)
+
+
+def start(nframes=1):
+    """ start tracing allocations if they are not already being traced """
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(nframes)
+
+
+def stop():
+    tracemalloc.stop()
+
+
+def default_filters():
+    """ only allocations from ontquery, excluding this module """
+    return [tracemalloc.Filter(True, os.path.join(_package_dir, '*')),
+            tracemalloc.Filter(False, __file__)]
+
+
+def snapshot(filters=None):
+    """ a tracemalloc snapshot filtered by filters, by default only
+        allocations made in ontquery are kept, tracing must be started """
+    if filters is None:
+        filters = default_filters()
+
+    return tracemalloc.take_snapshot().filter_traces(filters)
+
+
+def diff(old, new, key_type='lineno', limit=10):
+    """ the limit largest changes between two snapshots """
+    return new.compare_to(old, key_type)[:limit]
@@ -11,6 +11,10 @@ class rdflibLocal(OntService):  # reccomended for local default implementation
     # if loading if the default set of ontologies is too slow, it is possible to
     # dump loaded graphs to a pickle gzip and distribute that with a release...
 
+    # everything is in memory so there is no request to batch,
+    # but sending queries from threads would only add contention
+    batches = True
+
     def __init__(self, graph, OntId=oq.OntId):
         self.OntId = OntId
         self.graph = graph
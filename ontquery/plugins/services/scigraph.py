@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 import requests
 import ontquery as oq
 from ontquery.utils import cullNone, one_or_many, log, bunch, red
@@ -15,6 +16,7 @@ except ModuleNotFoundError:
 class SciGraphRemote(OntService):  # incomplete and not configureable yet
     cache = True
     verbose = False
+    max_workers = 8  # concurrent predicate retrievals per query
     known_inverses = ('', ''),
     def __init__(self, apiEndpoint=None, OntId=oq.OntId):  # apiEndpoint=None -> default from pyontutils.devconfig
         try:
@@ -172,6 +174,68 @@ class SciGraphRemote(OntService):  # incomplete and not configureable yet
                                   e['meta']['owlType'] != _disjoint_with_list)))
             yield from pred_objects
 
+    def _predicate_values(self, identifier, predicate, depth=1, direction='OUTGOING',
+                          entail=True, include_supers=False):
+        """ pred, values pairs for one predicate and for its inverse
+            if it has one, does not touch the result so that predicates
+            can be retrieved concurrently and merged in order """
+        def derp(p):
+            return p.curie if p.curie else str(p)
+
+        short = None
+        forward = []
+        inverse = []
+        if (hasattr(predicate, 'prefix') and
+            predicate.prefix in ('owl', 'rdfs')):
+            unshorten = derp(predicate)
+            predicate = predicate.suffix
+        else:
+            unshorten = None
+
+        ptest = predicate.curie if isinstance(predicate, self.OntId) else predicate
+
+        #log.debug(repr(predicate))
+        values = tuple(sorted(self._graphQuery(identifier, predicate, depth=depth,
+                                               direction=direction, entail=entail,
+                                               include_supers=include_supers)))
+        if values:
+            # FIXME when using query.predicates need to 'expand'
+            # the bare string predicates like subClassOf and isDefinedBy ...
+            bunched = bunch(values)
+            for pred, pvalues in bunched.items():
+                # I think this is the right place to unshorten
+                # I don't think we have any inverses that require unshortning
+                if pred == ptest:
+                    if unshorten is not None:
+                        short = predicate
+                        predicate = unshorten
+                        pred = predicate
+
+                forward.append((pred, tuple(pvalues)))
+
+        if predicate in self.inverses:
+            p = self.inverses[predicate]
+            inv_direction = ('OUTGOING' if
+                             direction == 'INCOMING' else
+                             ('INCOMING' if
+                              direction == 'OUTGOING'
+                              else direction))
+
+            # FIXME I'm betting reverse entailed is completely broken
+            inv_values = tuple(sorted(self._graphQuery(identifier, p,
+                                                       depth=depth, direction=inv_direction,
+                                                       entail=False, inverse=True,
+                                                       include_supers=include_supers)))  # FIXME entail=entail
+            if inv_values:
+                bunched = bunch(inv_values)
+                for pred, ipvalues in bunched.items():
+                    if short is not None and pred == short:
+                        pred = predicate
+
+                    inverse.append((pred, tuple(ipvalues)))
+
+        return forward, inverse
+
     def query(self, iri=None, curie=None,
               label=None, term=None, search=None, abbrev=None,  # FIXME abbrev -> any?
               prefix=tuple(), category=tuple(), exclude_prefix=tuple(),
@@ -244,63 +308,33 @@ class SciGraphRemote(OntService):  # incomplete and not configureable yet
                 return
 
             if predicates:  # TODO incoming/outgoing, 'ALL' by depth to avoid fanout
-                short = None
-                for predicate in predicates:
-                    if (hasattr(predicate, 'prefix') and
-                        predicate.prefix in ('owl', 'rdfs')):
-                        unshorten = next(derp([predicate]))
-                        predicate = predicate.suffix
-                    else:
-                        unshorten = None
-
-                    ptest = predicate.curie if isinstance(predicate, self.OntId) else predicate
-
-                    #log.debug(repr(predicate))
-                    values = tuple(sorted(self._graphQuery(identifier, predicate, depth=depth,
-                                                           direction=direction, entail=entail,
-                                                           include_supers=include_supers)))
-                    if values:
-                        # FIXME when using query.predicates need to 'expand'
-                        # the bare string predicates like subClassOf and isDefinedBy ...
-                        bunched = bunch(values)
-                        for pred, pvalues in bunched.items():
-                            # I think this is the right place to unshorten
-                            # I don't think we have any inverses that require unshortning
-                            if pred == ptest:
-                                if unshorten is not None:
-                                    short = predicate
-                                    predicate = unshorten
-                                    pred = predicate
-
+                def fetch(predicate):
+                    return self._predicate_values(identifier, predicate, depth=depth,
+                                                  direction=direction, entail=entail,
+                                                  include_supers=include_supers)
+
+                if len(predicates) > 1 and self.max_workers > 1:
+                    # the round trips for each predicate are independent
+                    with ThreadPoolExecutor(max_workers=min(self.max_workers,
+                                                            len(predicates))) as pool:
+                        fetched = list(pool.map(fetch, predicates))
+                else:
+                    fetched = [fetch(predicate) for predicate in predicates]
+
+                # merge in the order the predicates were requested
+                for forward, inverse in fetched:
+                    for pred, pvalues in forward:
+                        out_predicates.append(pred)
+                        result[pred] = pvalues
+
+                    for pred, ipvalues in inverse:
+                        if pred in result:
+                            rp = result[pred]
+                            fv = tuple(v for v in ipvalues if v not in rp)
+                            result[pred] += fv
+                        else:
+                            result[pred] = ipvalues
                             out_predicates.append(pred)
-                            result[pred] = tuple(pvalues)
-
-                    if predicate in self.inverses:
-                        p = self.inverses[predicate]
-                        inv_direction = ('OUTGOING' if
-                                         direction == 'INCOMING' else
-                                         ('INCOMING' if
-                                          direction == 'OUTGOING'
-                                          else direction))
-
-                        # FIXME I'm betting reverse entailed is completely broken
-                        inv_values = tuple(sorted(self._graphQuery(identifier, p,
-                                                                   depth=depth, direction=inv_direction,
-                                                                   entail=False, inverse=True,
-                                                                   include_supers=include_supers)))  # FIXME entail=entail
-                        if inv_values:
-                            bunched = bunch(inv_values)
-                            for pred, ipvalues in bunched.items():
-                                if short is not None and pred == short:
-                                    pred = predicate
-
-                                if pred in result:
-                                    rp = result[pred]
-                                    fv = tuple(v for v in ipvalues if v not in rp)
-                                    result[pred] += fv
-                                else:
-                                    result[pred] = tuple(ipvalues)
-                                    out_predicates.append(pred)
 
             res = self.sgg.getNode(identifier)
             types = tuple()
@@ -3,6 +3,8 @@ Implementation of the query interface that provides a layer of separation betwee
 identifiers and lookup services for finding and validating them.
 """
 
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from ontquery import plugin, exceptions as exc
 from ontquery.utils import mimicArgs, cullNone, one_or_many, log
 
@@ -26,6 +28,8 @@ class OntQuery:
             _services.append(service)
 
         self._services = tuple(_services)
+        self._bulk = None
+        self._bulk_lock = threading.Lock()
         if instrumented:
             self._instrumented = instrumented
             self._OntId = self._instrumented._uninstrumented_class()
@@ -89,6 +93,22 @@ class OntQuery:
     def __iter__(self):  # make it easier to init filtered queries
         yield from self.services
 
+    def add_to_bulk_fetch(self, term):
+        """ add a term to the pending bulk fetch, see bulk_fetch """
+        with self._bulk_lock:
+            if self._bulk is None:
+                self._bulk = BulkFetch(self)
+
+            self._bulk.add(term)
+            return self._bulk
+
+    def bulk_fetch(self):
+        """ resolve all terms added by add_to_bulk_fetch """
+        with self._bulk_lock:
+            bulk, self._bulk = self._bulk, None
+
+        return [] if bulk is None else bulk.fetch()
+
     def __call__(self, *args, **kwargs):
         """ first time only call """
         self.setup()
@@ -158,6 +178,126 @@ class OntQuery:
                         return  # FIXME order services based on which you want first for now, will work on merging later
 
 
+class BulkFetch:
+    """ Resolve many terms with as few round trips as possible.
+
+        Services are tried in the same order as OntQuery. Each one
+        is only sent the terms that have no labeled result yet.
+        Services that set batches get a single query_many for all of
+        those terms, the rest get concurrent single queries from a
+        pool of max_workers threads. The results are bound to the
+        waiting terms the same way as if each had been constructed
+        alone. """
+
+    def __init__(self, query, services=None, max_workers=8, cache=True):
+        self.query = query
+        self._services = services
+        self.max_workers = max_workers
+        self.cache = cache
+        self._terms = []
+
+    @property
+    def services(self):
+        return self.query.services if self._services is None else self._services
+
+    def add(self, *terms):
+        self._terms.extend(terms)
+        return self
+
+    add_to_bulk_fetch = add
+
+    def __len__(self):
+        return len(self._terms)
+
+    def _kwargs(self):
+        # same keywords that OntQuery passes for an identifier query
+        query = self.query
+        return {**cullNone(prefix=query._prefix if query._prefix else None,
+                           category=query._category if query._category else None),
+                'predicates': tuple(),
+                'depth': 1,
+                'direction': 'OUTGOING',
+                'include_deprecated': False,
+                'include_supers': False,
+                'limit': 10}
+
+    def _query_service(self, service, terms, kwargs):
+        """ identifier, results for each term from one service """
+        if service.batches or self.max_workers <= 1 or len(terms) == 1:
+            yield from service.query_many(terms, **kwargs)
+            return
+
+        def one(term):
+            return next(service.query_many((term,), **kwargs))
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(terms))) as pool:
+            yield from pool.map(one, terms)
+
+    def fetch(self):
+        """ query the services and bind the results, returns the terms """
+        terms, self._terms = self._terms, []
+        if not terms:
+            return terms
+
+        query = self.query
+        cache = terms[0]._cache
+        # the same iri only needs to be sent once
+        waiting = {}
+        for term in terms:
+            waiting.setdefault(term.iri, []).append(term)
+
+        # a subset of the services might not find the same result
+        shared = self._services is None
+        results = {}
+        if self.cache and shared:
+            for iri in waiting:
+                result = cache.get((query, iri))
+                if result is not None:
+                    results[iri] = [result]
+
+        cached = set(results)
+        todo = [same[0] for iri, same in waiting.items() if iri not in cached]
+        if todo:
+            if not all(service.started for service in self.services):
+                query.setup()
+
+            for iri in waiting:
+                results.setdefault(iri, [])
+
+            kwargs = self._kwargs()
+            for service in self.services:
+                if not todo:
+                    break
+
+                for term, service_results in self._query_service(service, todo, kwargs):
+                    found = results[term.iri]
+                    for result in service_results:
+                        if result:
+                            found.append(result)
+                            if result.label:
+                                break
+
+                todo = [term for term in todo
+                        if not any(r.label for r in results[term.iri])]
+
+        for iri, same in waiting.items():
+            try:
+                result = same[0]._select_result(results[iri])
+            except StopIteration:
+                for term in same:
+                    term._bind_failed()
+
+                continue
+
+            if shared and iri not in cached:
+                cache.add((query, iri), result)
+
+            for term in same:
+                term._bind_query_result(result)
+
+        return terms
+
+
 class OntQueryCli(OntQuery):
     raw = False  # return raw QueryResults
 
@@ -173,6 +313,8 @@ class OntQueryCli(OntQuery):
             self._services = query.services
             self._instrumented = query._instrumented
             self._OntId = query._OntId
+            self._bulk = None
+            self._bulk_lock = threading.Lock()
 
         else:
             super().__init__(*services, prefix=prefix, category=category,
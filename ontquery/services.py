@@ -38,6 +38,19 @@ class OntService:
         yield 'Queries should return an iterable'
         raise NotImplementedError()
 
+    # True if query_many resolves many identifiers in a single request
+    # BulkFetch sends concurrent single queries to services that don't
+    batches = False
+
+    def query_many(self, identifiers, **kwargs):
+        """ yield identifier, results for many identifiers, override
+            along with batches = True for services that can send them
+            all in one request, kwargs are the same as for query """
+        for identifier in identifiers:
+            yield identifier, list(self.query(iri=identifier.iri,
+                                              curie=identifier.curie,
+                                              **kwargs))
+
 
 class BasicService(OntService):
     """ A very simple service for local use only """
@@ -1,10 +1,16 @@
 import sys
 import copy
+import pickle
+import weakref
+import threading
+from types import MappingProxyType
 from itertools import chain
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import quote
 from . import exceptions as exc, trie
-from .utils import cullNone, subclasses, log, SubClassCompare, _already_logged
-from .query import OntQuery
+from .utils import cullNone, subclasses, log, SubClassCompare, _already_logged, MemoCache
+from .utils import ContextVar, LRUCache
+from .query import OntQuery, BulkFetch
 
 # FIXME ipython notebook?
 # this still seems wrong, I want to know not how the file is running
@@ -15,12 +21,45 @@ interactive = getattr(sys, 'ps1', sys.flags.interactive)
 
 class dictclass(type):
 
+    def __new__(mcls, name, bases, namespace, **kwargs):
+        if '_dict' in namespace:
+            # subclasses that set _dict, _n_to_p, _strie, and _trie in
+            # their body to get a mapping of their own, e.g. in idlib
+            curies = namespace.pop('_dict')
+            for legacy in ('_n_to_p', '_strie', '_trie'):
+                namespace.pop(legacy, None)
+
+            namespace['_snapshot'] = FrozenCuries.empty().merge(
+                curies, {n:p for p, n in curies.items()})
+
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+    @property
+    def mapping(self):
+        """ read only view of the active curie map, this is a plain
+            attribute read and does not allocate anything
+
+            the view is of the current snapshot and does not change
+            if prefixes are registered after it is retrieved """
+        try:
+            return self._snapshot._mapping
+        except AttributeError:
+            self()
+            return self._snapshot._mapping
+
+    # read only access to the current snapshot for old code, writes
+    # have to go through the class so that the memo is invalidated
+    _dict = property(lambda self: self._snapshot._mapping)
+    _n_to_p = property(lambda self: MappingProxyType(self._snapshot._n_to_p))
+    # NamespaceIndex has no read only form, old code gets a copy
+    _trie = property(lambda self: self._snapshot._trie.copy())
+
     def values(self):
         return self._dict.values()
 
     def __setitem__(self, key, value):
         if key not in self._dict:
-            self._dict[key] = value
+            self({key: value})
         elif self._dict[key] == value:
             pass
         else:
@@ -29,73 +68,196 @@ class dictclass(type):
     def __iter__(self):
         return iter(self._dict)
 
+    def __contains__(self, key):
+        return key in self.mapping
+
+    def __len__(self):
+        return len(self.mapping)
+
     def __getitem__(self, key):
         return self._dict[key]
 
 
-class OntCuries(metaclass=dictclass):
-    """ A bad implementation of a singleton dictionary based namespace.
-        Probably better to use metaclass= to init this so types can be tracked.
-    """
-    # TODO how to set an OntCuries as the default...
-    def __new__(cls, *args, **kwargs):
-        #if not hasattr(cls, '_' + cls.__name__ + '_dict'):
-        if not hasattr(cls, '_dict'):
-            cls._dict = {}
-            cls._n_to_p = {}
-            cls._strie = {}
-            cls._trie = {}
+class FrozenCuries:
+    """ An immutable compiled curie map. OntCuries publishes a new one
+        every time prefixes are registered so readers never need a lock.
+        It pickles cheaply and can be loaded by OntCuries.load_snapshot
+        so that workers start with a ready to use namespace index.
 
-        for p, namespace in dict(*args, **kwargs).items():
-            sn = str(namespace)
-            trie.insert_trie(cls._trie, sn)
-            cls._dict[p] = sn
-            cls._n_to_p[sn] = p
+        The qname memo and the per generation indexes are caches, they
+        are filled in by readers and are not part of the pickled state. """
 
-        if args or kwargs:
-            cls._pn = sorted(cls._dict.items(), key=lambda kv: len(kv[1]), reverse=True)
+    __slots__ = ('_dict', '_n_to_p', '_trie', '_mapping', '_memo')
 
-        return cls._dict
+    def __init__(self, p_to_n, n_to_p, namespace_index,
+                 generation=0, memo_maxsize=2 ** 16):
+        # takes ownership of its arguments, pass copies
+        object.__setattr__(self, '_dict', p_to_n)
+        object.__setattr__(self, '_n_to_p', n_to_p)
+        object.__setattr__(self, '_trie', namespace_index)
+        object.__setattr__(self, '_mapping', MappingProxyType(p_to_n))
+        object.__setattr__(self, '_memo', MemoCache(memo_maxsize, generation))
 
     @classmethod
-    def reset(cls):
-        delattr(cls, '_dict')
+    def empty(cls, memo_maxsize=2 ** 16):
+        return cls({}, {}, trie.NamespaceIndex(), memo_maxsize=memo_maxsize)
 
-    @classmethod
-    def new(cls):
-        # FIXME yet another pattern that I don't like :/
-        clsdict = dict(_dict={},
-                       _n_to_p={},
-                       _strie={},
-                       _trie={},)
+    def __setattr__(self, name, value):
+        raise exc.ReadOnlyError(f'{self.__class__.__name__} is immutable')
 
-        return type('OntCuries', (OntCuries,), clsdict)  # FIXME this does not subclass propertly even when using cls ... :/
+    def __reduce__(self):
+        return self.__class__, (self._dict, self._n_to_p, self._trie)
 
-    @classmethod
-    def populate(cls, graph):
-        """ populate an rdflib graph with these curies """
-        [graph.bind(k, v) for k, v in cls._dict.items()]
+    def merge(self, p_to_n, n_to_p):
+        """ a new snapshot with these entries, self if nothing would change
 
-    @classmethod
-    def identifier_prefixes(cls, curie_iri_prefix):
-        return [cls._n_to_p[n] for n in cls.identifier_namespaces(curie_iri_prefix)]
+            the maps and the namespace index are copied so a merge is
+            linear in the size of the whole map, not just the new entries """
+        changed = (any(self._dict.get(p) != n for p, n in p_to_n.items()) or
+                   any(self._n_to_p.get(n) != p for n, p in n_to_p.items()))
+        if not changed:
+            return self
+
+        new_p_to_n = dict(self._dict)
+        new_p_to_n.update(p_to_n)
+        new_n_to_p = dict(self._n_to_p)
+        new_n_to_p.update(n_to_p)
+        index = self._trie.copy()
+        index.update(n_to_p)
+        # any new prefix or namespace can change the output of qname
+        # so the new snapshot starts the next memo generation
+        return self.__class__(new_p_to_n, new_n_to_p, index,
+                              self._memo.generation + 1, self._memo.maxsize)
+
+    def dump(self, path):
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
 
     @classmethod
-    def identifier_namespaces(cls, curie_iri_prefix):
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            frozen = pickle.load(f)
+
+        if not isinstance(frozen, cls):
+            raise TypeError(f'{path} does not contain a {cls.__name__}')
+
+        return frozen
+
+    def keys(self):
+        return self._dict.keys()
+
+    def values(self):
+        return self._dict.values()
+
+    def items(self):
+        return self._dict.items()
+
+    def __getitem__(self, key):
+        return self._dict[key]
+
+    def __iter__(self):
+        return iter(self._dict)
+
+    def __len__(self):
+        return len(self._dict)
+
+    def __contains__(self, key):
+        return key in self._dict
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(<{len(self)} prefixes>)'
+
+    def identifier_prefixes(self, curie_iri_prefix):
+        namespace = self._identifier_namespace(curie_iri_prefix)
+        return list(self._identifier_index()[1][namespace]) if namespace else []
+
+    def identifier_namespaces(self, curie_iri_prefix):
+        namespace = self._identifier_namespace(curie_iri_prefix)
+        return list(self._identifier_index()[0][namespace]) if namespace else []
+
+    def _identifier_namespace(self, curie_iri_prefix):
+        """ the longest registered namespace for a curie, iri, or prefix """
         if ':' not in curie_iri_prefix:
-            iri = cls._dict[curie_iri_prefix]
+            return self._dict[curie_iri_prefix]
         elif '://' in curie_iri_prefix:
-            iri = curie_iri_prefix
+            return self._trie.longest(curie_iri_prefix)
         else:
-            iri = cls._dict[curie_iri_prefix.split(':', 1)[0]]
+            return self._dict[curie_iri_prefix.split(':', 1)[0]]
 
-        return list(trie.get_namespaces(cls._trie, iri))
+    def _identifier_index(self):
+        """ namespace -> enclosing namespaces and namespace -> their
+            prefixes, shortest first, built once per snapshot """
+        derived = self._memo.derived
+        try:
+            return derived['identifier_index']
+        except KeyError:
+            namespaces = {n:tuple(self._trie.namespaces(n)) for n in self._n_to_p}
+            prefixes = {n:tuple(self._n_to_p[e] for e in enclosing)
+                        for n, enclosing in namespaces.items()}
+            index = derived['identifier_index'] = namespaces, prefixes
+            return index
+
+    def memo_for(self, key):
+        """ a bounded memo owned by key that lives as long as this
+            snapshot, for values computed from the curies """
+        derived = self._memo.derived
+        try:
+            return derived[key]
+        except KeyError:
+            memo = derived[key] = MemoCache(self._memo.maxsize)
+            return memo
 
-    @classmethod
-    def qname(cls, iri):
+    def qname(self, iri):
+        cache = self._memo
+        key = iri if type(iri) == str else str(iri)
+        try:
+            curie = cache.memo[key]
+        except KeyError:
+            cache.misses += 1
+            curie = self._qname(iri)
+            # None marks the unsplitable case where the input is returned
+            # as is, so that URIRef and friends round trip with their type
+            cache.add(key, None if curie is iri else curie)
+            return curie
+
+        cache.hits += 1
+        return iri if curie is None else curie
+
+    def qname_many(self, iris):
+        qname = self.qname
+        done = {}
+        out = []
+        for iri in iris:
+            curie = done.get(iri)
+            if curie is None:
+                curie = done[iri] = qname(iri)
+
+            out.append(curie)
+
+        return out
+
+    def expand_many(self, curies, strict=True):
+        namespaces = self._dict
+        out = []
+        for curie in curies:
+            prefix, sep, suffix = curie.partition(':')
+            namespace = namespaces.get(prefix) if sep else None
+            if namespace is None:
+                if strict:
+                    if sep:
+                        raise KeyError(f'Unknown curie prefix: {prefix} for {curie}')
+                    else:
+                        raise ValueError(f'Could not split curie {curie!r}')
+
+                out.append(None)
+            else:
+                out.append(namespace + suffix)
+
+        return out
+
+    def _qname(self, iri):
         # while / is not *technically* allowed in prefix names by ttl
         # RDFa and JSON-LD do allow it, so we are going to allow it too
-        # TODO cache the output mapping?
         try:
             namespace, suffix = trie.split_uri(iri)
             if namespace.endswith('://'):
@@ -103,42 +265,177 @@ class OntCuries(metaclass=dictclass):
         except ValueError as e:
             try:
                 namespace = str(iri)
-                prefix = cls._n_to_p[namespace]
+                prefix = self._n_to_p[namespace]
                 return prefix + ':'
             except KeyError as e:
                 return iri  # can't split it then we're in trouble probably
 
-        if namespace not in cls._strie:
-            trie.insert_strie(cls._strie, cls._trie, namespace)
-
-        if cls._strie[namespace]:
-            pl_namespace = trie.get_longest_namespace(cls._strie[namespace], iri)
-            if pl_namespace is not None:
-                namespace = pl_namespace
-                suffix = iri[len(namespace):]
+        # a registered namespace longer than the split point wins
+        # e.g. UBERON: over obo: for obo/UBERON_0000955
+        pl_namespace = self._trie.longest(iri, len(namespace))
+        if pl_namespace is not None:
+            namespace = pl_namespace
+            suffix = iri[len(namespace):]
 
         try:
-            prefix = cls._n_to_p[namespace]
+            prefix = self._n_to_p[namespace]
             return ':'.join((prefix, suffix))
         except KeyError:
             new_iri = namespace[:-1]
             sep = namespace[-1]
-            qname = cls.qname(new_iri)
+            qname = self.qname(new_iri)
             # this works because when we get to an unsplitable case we simply fail
-            # caching can help with performance here because common prefixes that
+            # the memo in qname helps here because common prefixes that
             # have not been shortened will show up in the cache
             return qname + sep + suffix
 
-    @classmethod
-    def _qname_old(cls, iri):
+    def _qname_old(self, iri):
         # sort in reverse to match longest matching namespace first TODO/FIXME trie
-        for prefix, namespace in cls._pn:
+        derived = self._memo.derived
+        if 'pn' not in derived:
+            derived['pn'] = sorted(self._dict.items(), key=lambda kv: len(kv[1]), reverse=True)
+
+        for prefix, namespace in derived['pn']:
             if iri.startswith(namespace):
                 suffix = iri[len(namespace):]
                 return ':'.join((prefix, suffix))
         return iri
 
 
+class OntCuries(metaclass=dictclass):
+    """ A bad implementation of a singleton dictionary based namespace.
+        Probably better to use metaclass= to init this so types can be tracked.
+
+        The mapping is held in an immutable FrozenCuries snapshot. Readers
+        use whichever snapshot is current without locking, registering
+        prefixes builds a new snapshot under a lock and publishes it on
+        the class that owns the mapping, copy on write.
+
+        Every registration that changes the map copies all of it, so
+        register a prefix map with one call rather than one prefix at
+        a time. Calling the class returns a read only view of the map. """
+    qname_cache_maxsize = 2 ** 16
+    _write_lock = threading.RLock()
+
+    # TODO how to set an OntCuries as the default...
+    def __new__(cls, *args, **kwargs):
+        p_to_n = {p:str(namespace) for p, namespace in dict(*args, **kwargs).items()}
+        n_to_p = {n:p for p, n in p_to_n.items()}
+        with cls._write_lock:
+            #if not hasattr(cls, '_' + cls.__name__ + '_dict'):
+            if not hasattr(cls, '_snapshot'):
+                cls._snapshot = FrozenCuries.empty(cls.qname_cache_maxsize)
+
+            if p_to_n:
+                cls._merge(p_to_n, n_to_p)
+
+        return cls.mapping
+
+    @classmethod
+    def _owner(cls):
+        """ the class that owns the mapping, classes that share it
+            only differ in their name e.g. LocalCuries in SciGraphRemote """
+        for klass in cls.__mro__:
+            if '_snapshot' in vars(klass):
+                return klass
+
+    @classmethod
+    def _merge(cls, p_to_n, n_to_p):
+        # caller must hold _write_lock
+        owner = cls._owner()
+        owner._snapshot = owner._snapshot.merge(p_to_n, n_to_p)
+
+    @classmethod
+    def reset(cls):
+        with cls._write_lock:
+            owner = cls._owner() or cls
+            owner._snapshot = FrozenCuries.empty(cls.qname_cache_maxsize)
+
+    @classmethod
+    def new(cls):
+        # FIXME yet another pattern that I don't like :/
+        clsdict = dict(_snapshot=FrozenCuries.empty(cls.qname_cache_maxsize))
+        return type('OntCuries', (OntCuries,), clsdict)  # FIXME this does not subclass propertly even when using cls ... :/
+
+    @classmethod
+    def freeze(cls):
+        """ the current snapshot, see FrozenCuries """
+        cls()  # make sure that there is something to freeze
+        return cls._snapshot
+
+    @classmethod
+    def load_snapshot(cls, path):
+        """ merge a FrozenCuries, or a path to a pickled one,
+            into this mapping without recompiling the snapshot """
+        frozen = path if isinstance(path, FrozenCuries) else FrozenCuries.load(path)
+        cls()
+        with cls._write_lock:
+            owner = cls._owner()
+            if not owner._snapshot._dict:
+                owner._snapshot = frozen
+            else:
+                owner._snapshot = owner._snapshot.merge(frozen._dict, frozen._n_to_p)
+
+        return cls.mapping
+
+    @classmethod
+    def populate(cls, graph):
+        """ populate an rdflib graph with these curies """
+        [graph.bind(k, v) for k, v in cls._dict.items()]
+
+    @classmethod
+    def identifier_prefixes(cls, curie_iri_prefix):
+        return cls._snapshot.identifier_prefixes(curie_iri_prefix)
+
+    @classmethod
+    def identifier_namespaces(cls, curie_iri_prefix):
+        return cls._snapshot.identifier_namespaces(curie_iri_prefix)
+
+    @classmethod
+    def _identifier_index(cls):
+        return cls._snapshot._identifier_index()
+
+    @classmethod
+    def qname_cache_info(cls):
+        """ hits, misses, maxsize, currsize, and generation of the qname memo
+            the counters are not locked so they are approximate under threads """
+        return cls._snapshot._memo.info()
+
+    @classmethod
+    def qname(cls, iri):
+        # the memo belongs to the current snapshot so registering
+        # a prefix starts a new memo generation for free
+        return cls._snapshot.qname(iri)
+
+    @classmethod
+    def qname_many(cls, iris):
+        """ qname a column of iris, each distinct iri is only resolved once """
+        return cls._snapshot.qname_many(iris)
+
+    @classmethod
+    def expand_many(cls, curies, strict=True):
+        """ expand a column of curies to iris
+
+            if strict is False then curies that cannot be expanded
+            are returned as None instead of raising an error """
+        return cls._snapshot.expand_many(curies, strict=strict)
+
+    @classmethod
+    def _qname_old(cls, iri):
+        return cls._snapshot._qname_old(iri)
+
+
+# repr configuration that is local to the current thread or task
+# the values are only ever replaced, never mutated, so that copies
+# of a context cannot see each others changes, see OntId.set_next_repr
+_repr_args = ContextVar('ontquery_repr_args', default={})  # cls -> repr_args
+_repr_oneshot = ContextVar('ontquery_repr_oneshot', default={})  # cls -> repr_args to restore
+_repr_levels = ContextVar('ontquery_repr_levels', default={})  # cls -> repr level
+_unset = object()
+# OntTerm.fetch_many constructs terms first and binds them all at once
+_defer_bind = ContextVar('ontquery_defer_bind', default=False)
+
+
 class Id:
     """ base for all identifiers, both local and global """
 
@@ -158,18 +455,23 @@ class LocalId(Id):
 class Identifier(Id):
     """ any global identifier, manages the local/global transition """
 
+    # (cls, instrumented) -> resolved class, cleared when a new
+    # subclass is defined since that can change the resolution
+    _class_cache = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Identifier._class_cache.clear()
+
     def __hash__(self):
         return hash((self.__class__, super().__hash__()))
 
     def __eq__(self, other):
-        def complex_type_compare(a, b):
-            # if both are instrumed, or both are not instrumed
-            # then proceed to compare
-            aii = isinstance(a, InstrumentedIdentifier)
-            bii = isinstance(b, InstrumentedIdentifier)
-            return aii and bii or (not aii and not bii)  # (not (xor aii bii))
-
-        if type(self) == type(other) or complex_type_compare(self, other):
+        # if both are instrumented, or both are not instrumented
+        # then proceed to compare
+        if (type(self) == type(other) or
+            isinstance(self, InstrumentedIdentifier) ==
+            isinstance(other, InstrumentedIdentifier)):
             return str(self) == str(other)
 
         else:
@@ -196,6 +498,22 @@ class Identifier(Id):
 
     @classmethod
     def _instrumented_class(cls):
+        try:
+            return Identifier._class_cache[cls, True]
+        except KeyError:
+            klass = Identifier._class_cache[cls, True] = cls._find_instrumented_class()
+            return klass
+
+    @classmethod
+    def _uninstrumented_class(cls):
+        try:
+            return Identifier._class_cache[cls, False]
+        except KeyError:
+            klass = Identifier._class_cache[cls, False] = cls._find_uninstrumented_class()
+            return klass
+
+    @classmethod
+    def _find_instrumented_class(cls):
         if issubclass(cls, InstrumentedIdentifier): 
             return cls
 
@@ -227,7 +545,7 @@ class Identifier(Id):
             raise TypeError(f'Don\'t know what to do with a {type(cls)}')
 
     @classmethod
-    def _uninstrumented_class(cls):
+    def _find_uninstrumented_class(cls):
         # FIXME walking back down the hierarchy there can be another instrumented
         # class that appears first, if this happens (because we didn't explicilty)
         # subclass the uninstrumented class, then we need to construct a new one
@@ -295,10 +613,22 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
                       ('prefix', 'suffix'),
                       ('iri',))
     _firsts = 'curie', 'iri'  # FIXME bad for subclassing __repr__ behavior :/
+    _intern = False  # see set_interning
+    _repr_templates = {}  # (cls, args) -> format string, see _repr_template
+    _lazy = False  # see set_lazy
     class Error(Exception): pass
     class BadCurieError(Error): pass
     class UnknownPrefixError(Error): pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # interning and lazy construction are enabled per class
+        if '_intern' not in cls.__dict__:
+            cls._intern = False
+
+        if '_lazy' not in cls.__dict__:
+            cls._lazy = False
+
     def __new__(cls, curie_or_iri=None, prefix=None, suffix=None, curie=None,
                 iri=None, **kwargs):
 
@@ -307,67 +637,117 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
         elif isinstance(curie_or_iri, cls):
             return cls(str(curie_or_iri))
 
-        if not hasattr(cls, f'_{cls.__name__}__repr_level'):
-            cls.__repr_level = 0
-            cls._oneshot_old_repr_args = None
-            if not hasattr(cls, 'repr_args'):
-                cls.repr_args = cls.repr_arg_order[0]
+        # memos and intern tables are keyed on plain strings so that
+        # they never keep an input OntId, OntTerm, or URIRef alive
+        key = (str(curie_or_iri) if isinstance(curie_or_iri, str) and
+               type(curie_or_iri) is not str else curie_or_iri)
+        if cls._intern:
+            interned = cls._interned()
+            if (curie_or_iri is not None and prefix is None and
+                curie is None and iri is None):
+                # iris hit without having to qname them
+                self = interned.get(key)
+                if self is not None:
+                    return self
+
+        if not hasattr(cls, 'repr_args'):
+            cls.repr_args = cls.repr_arg_order[0]
+
+        if (cls._lazy and curie_or_iri is not None and prefix is None and
+            suffix is None and curie is None and iri is None):
+            iri = cls._lazy_iri(curie_or_iri)
+            if cls._intern:
+                self = interned.get(iri)
+                if self is not None:
+                    return self
+
+            self = super().__new__(cls, iri)
+            if cls._intern:
+                self = interned.setdefault(iri, self)
 
-        iri_ps, iri_ci, iri_c = None, None, None
+            return self
 
-        if prefix is not None and suffix is not None:
-            #curie_ps = ':'.join(prefix, suffix)
-            iri_ps = cls._make_iri(prefix, suffix)
+        elif (curie_or_iri is not None and prefix is None and suffix is None and
+              curie is None and iri is None):
+            # fast path for a bare curie or iri, iri, prefix, and suffix
+            # are computed once per curie map and then reused
+            try:
+                snapshot = cls._namespaces._snapshot
+            except AttributeError:
+                snapshot = cls._namespaces.freeze()
 
-        if curie_or_iri is not None:
-            if (curie_or_iri.startswith('http://') or
-                curie_or_iri.startswith('https://') or
-                curie_or_iri.startswith('file://')):
-                iri_ci = curie_or_iri
-                curie_ci = cls._namespaces.qname(iri_ci)
-                if curie_ci != iri_ci:  # FIXME this is bad ... figure out where qname returning None is an issue ...
-                    prefix, suffix = curie_ci.split(':', 1)
-                else:
-                    prefix, suffix = None, None
-            else:
-                curie_ci = curie_or_iri
-                try:
-                    prefix, suffix = curie_ci.split(':', 1)
-                except ValueError as e:
-                    raise cls.BadCurieError(f'Could not split curie {curie_ci!r} '
-                                            'is it actually an identifier?') from e
-                iri_ci = cls._make_iri(prefix, suffix)
-
-        if curie is not None and curie != iri:
-            prefix, suffix = curie.split(':', 1)
-            iri_c = cls._make_iri(prefix, suffix)
-
-        iris = iri_ps, iri_ci, iri_c, iri
-        unique_iris = set(i for i in iris if i is not None)
-
-        if len(unique_iris) > 1:
-            breakpoint()
-            raise ValueError(f'All ways of constructing iris not match! {sorted(unique_iris)}')
-        else:
             try:
-                iri = next(iter(unique_iris))
-            except StopIteration as e:
-                raise TypeError('No identifier was provided!') from e
+                iri, prefix, suffix = snapshot._memo.derived[cls].memo[key]
+            except KeyError:
+                iri, prefix, suffix = cls._resolve(key)
+                snapshot.memo_for(cls).add(key, (iri, prefix, suffix))
 
-        if iri is not None:
-            # normalization step in case there is a longer prefix match
-            curie_i = cls._namespaces.qname(iri)
-            if curie_i != iri:  # FIXME TODO same issue as above with qname returning None
-                prefix_i, suffix_i = curie_i.split(':', 1)
+            if cls._intern:
+                self = interned.get(iri)
+                if self is not None:
+                    return self
+
+        else:
+            iri_ps, iri_ci, iri_c = None, None, None
+
+            if prefix is not None and suffix is not None:
+                #curie_ps = ':'.join(prefix, suffix)
+                iri_ps = cls._make_iri(prefix, suffix)
+
+            if curie_or_iri is not None:
+                if (curie_or_iri.startswith('http://') or
+                    curie_or_iri.startswith('https://') or
+                    curie_or_iri.startswith('file://')):
+                    iri_ci = curie_or_iri
+                    curie_ci = cls._namespaces.qname(iri_ci)
+                    if curie_ci != iri_ci:  # FIXME this is bad ... figure out where qname returning None is an issue ...
+                        prefix, suffix = curie_ci.split(':', 1)
+                    else:
+                        prefix, suffix = None, None
+                else:
+                    curie_ci = curie_or_iri
+                    try:
+                        prefix, suffix = curie_ci.split(':', 1)
+                    except ValueError as e:
+                        raise cls.BadCurieError(f'Could not split curie {curie_ci!r} '
+                                                'is it actually an identifier?') from e
+                    iri_ci = cls._make_iri(prefix, suffix)
+
+            if curie is not None and curie != iri:
+                prefix, suffix = curie.split(':', 1)
+                iri_c = cls._make_iri(prefix, suffix)
+
+            iris = iri_ps, iri_ci, iri_c, iri
+            unique_iris = set(i for i in iris if i is not None)
+
+            if len(unique_iris) > 1:
+                raise ValueError(f'All ways of constructing iris not match! {sorted(unique_iris)}')
             else:
-                prefix_i, suffix_i = None, None
+                try:
+                    iri = next(iter(unique_iris))
+                except StopIteration as e:
+                    raise TypeError('No identifier was provided!') from e
+
+            if cls._intern:
+                self = interned.get(iri)
+                if self is not None:
+                    return self
+
+            if iri is not None:
+                # normalization step in case there is a longer prefix match
+                curie_i = cls._namespaces.qname(iri)
+                if curie_i != iri:  # FIXME TODO same issue as above with qname returning None
+                    prefix_i, suffix_i = curie_i.split(':', 1)
+                    prefix_i = sys.intern(prefix_i)
+                else:
+                    prefix_i, suffix_i = None, None
 
-            #if prefix and prefix_i != prefix:
-                #print('Curie changed!', prefix + ':' + suffix, '->', curie_i)
-            prefix, suffix = prefix_i, suffix_i
-            if ((suffix is not None and not suffix.startswith('//') and curie_i == iri)
-                or (suffix is None and '://' not in iri and curie_i == iri)):
-                raise ValueError(f'You have provided a curie {curie_i} as an iri!')
+                #if prefix and prefix_i != prefix:
+                    #print('Curie changed!', prefix + ':' + suffix, '->', curie_i)
+                prefix, suffix = prefix_i, suffix_i
+                if ((suffix is not None and not suffix.startswith('//') and curie_i == iri)
+                    or (suffix is None and '://' not in iri and curie_i == iri)):
+                    raise ValueError(f'You have provided a curie {curie_i} as an iri!')
 
         if prefix is not None and (' ' in prefix or ' ' in suffix):
             raise cls.BadCurieError(f'{prefix}:{suffix} has an invalid charachter in it!')
@@ -375,13 +755,227 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
         self = super().__new__(cls, iri)
 
         # FIXME these assignments prevent updates when OntCuries changes
-        self.prefix = prefix
-        self.suffix = suffix
+        # a plain dict is about half the size of the key sharing dict
+        # that str subclasses get, str subclasses cannot use __slots__
+        self.__dict__ = {'prefix': prefix, 'suffix': suffix}
+        if cls._intern:
+            self = interned.setdefault(iri, self)
+            if key is not None and key != iri:
+                # curies are only valid for the current table
+                # so they can alias the iri in the same table
+                interned[key] = self
+
+        return self
+
+    def __hash__(self):
+        return hash((self.__class__, str.__hash__(self)))
+
+    def __eq__(self, other):
+        # same as Identifier.__eq__ without copying self to a str
+        if type(self) is type(other):
+            return str.__eq__(self, other)
+        elif (isinstance(self, InstrumentedIdentifier) ==
+              isinstance(other, InstrumentedIdentifier)):
+            return str.__eq__(self, other if isinstance(other, str) else str(other))
+        else:
+            return False
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    @classmethod
+    def _resolve(cls, curie_or_iri):
+        """ iri, prefix, and suffix for a bare curie or iri, with
+            the same validation as the general case in __new__
+            except for the invalid charachter check which both share """
+        # str.startswith because rdflib nodes override it
+        if str.startswith(curie_or_iri, ('http://', 'https://', 'file://')):
+            iri = curie_or_iri
+        else:
+            try:
+                prefix, suffix = curie_or_iri.split(':', 1)
+            except ValueError as e:
+                raise cls.BadCurieError(f'Could not split curie {curie_or_iri!r} '
+                                        'is it actually an identifier?') from e
+            iri = cls._make_iri(prefix, suffix)
+
+        return (iri,) + cls._prefix_suffix(iri)
+
+    @classmethod
+    def _prefix_suffix(cls, iri):
+        # normalization step in case there is a longer prefix match
+        curie_i = cls._namespaces.qname(iri)
+        if curie_i != iri:
+            prefix, suffix = curie_i.split(':', 1)
+            prefix = sys.intern(prefix)  # there are few prefixes and many ids
+        elif '://' not in iri:
+            raise ValueError(f'You have provided a curie {curie_i} as an iri!')
+        else:
+            prefix, suffix = None, None
+
+        return prefix, suffix
+
+    @classmethod
+    def _lazy_iri(cls, curie_or_iri):
+        """ only what is needed to get the iri, see set_lazy """
+        if str.startswith(curie_or_iri, ('http://', 'https://', 'file://')):
+            return curie_or_iri
+
+        try:
+            prefix, suffix = curie_or_iri.split(':', 1)
+        except ValueError as e:
+            raise cls.BadCurieError(f'Could not split curie {curie_or_iri!r} '
+                                    'is it actually an identifier?') from e
+
+        if ' ' in prefix or ' ' in suffix:
+            raise cls.BadCurieError(f'{prefix}:{suffix} has an invalid charachter in it!')
+
+        return cls._make_iri(prefix, suffix)
+
+    def __getattr__(self, name):
+        # only called when prefix and suffix have not been set, see set_lazy
+        if name != 'prefix' and name != 'suffix':
+            raise AttributeError(f'{self.__class__.__name__!r} object '
+                                 f'has no attribute {name!r}')
+
+        prefix, suffix = self._prefix_suffix(str(self))
+        if prefix is not None and (' ' in prefix or ' ' in suffix):
+            raise self.BadCurieError(f'{prefix}:{suffix} has an invalid charachter in it!')
+
+        d = self.__dict__
+        d['prefix'] = prefix
+        d['suffix'] = suffix
+        return d[name]
+
+    @classmethod
+    def set_lazy(cls, enabled=True):
+        """ construct ids from a bare curie or iri without working out
+            their prefix and suffix, for ids that are only used as iris
+
+            prefix, suffix, and curie are computed on first access from
+            the curies at that time, normalization to the longest prefix
+            and the checks that depend on it are also deferred until then
+
+            subclasses are not affected, call it on each class to use it """
+        cls._lazy = enabled
+
+    @classmethod
+    def _from_parts(cls, iri, prefix, suffix):
+        """ construct from an iri, prefix, and suffix from _resolve """
+        self = super().__new__(cls, iri)
+        self.__dict__ = {'prefix': prefix, 'suffix': suffix}
         return self
 
+    @classmethod
+    def _from_iri(cls, iri):
+        """ construct from an iri from _lazy_iri """
+        return super().__new__(cls, iri)
+
+    @classmethod
+    def from_many(cls, curies_or_iris, errors='raise', generate=False):
+        """ construct ids for a column of curies or iris
+
+            all items are resolved against the same curie map and each
+            distinct value is only resolved once
+
+            errors controls what happens to values that cannot be
+            made into an id, 'raise' the error, 'skip' the value,
+            or 'mark' its position in the output with the error
+
+            returns a list, or a generator if generate is True """
+        if errors not in ('raise', 'skip', 'mark'):
+            raise ValueError(f'unknown errors policy {errors!r}')
+
+        gen = cls._from_many(curies_or_iris, errors)
+        return gen if generate else list(gen)
+
+    @classmethod
+    def _from_many(cls, curies_or_iris, errors):
+        snapshot = cls._namespaces.freeze()
+        memo = snapshot.memo_for(cls)
+        resolved = memo.memo
+        interned = cls._interned() if cls._intern else None
+        lazy = cls._lazy
+        for value in curies_or_iris:
+            if type(value) == cls:
+                yield value
+                continue
+
+            # construction is guarded too, for OntTerm it binds
+            # a query result which can fail validation
+            try:
+                if isinstance(value, str) and type(value) is not str:
+                    value = str(value)  # see the memo keys in __new__
+
+                if lazy:
+                    if value is None:
+                        raise TypeError('No identifier was provided!')
+
+                    iri = cls._lazy_iri(value)
+                    construct, args = cls._from_iri, (iri,)
+                else:
+                    try:
+                        iri, prefix, suffix = resolved[value]
+                    except KeyError:
+                        if value is None:
+                            raise TypeError('No identifier was provided!')
+
+                        iri, prefix, suffix = cls._resolve(value)
+                        memo.add(value, (iri, prefix, suffix))
+
+                    if prefix is not None and (' ' in prefix or ' ' in suffix):
+                        raise cls.BadCurieError(f'{prefix}:{suffix} has an invalid charachter in it!')
+
+                    construct, args = cls._from_parts, (iri, prefix, suffix)
+
+                if interned is None:
+                    self = construct(*args)
+                else:
+                    self = interned.get(iri)
+                    if self is None:
+                        self = interned.setdefault(iri, construct(*args))
+
+            except (cls.Error, ValueError, TypeError) as e:
+                if errors == 'raise':
+                    raise
+                elif errors == 'mark':
+                    yield e
+
+                continue
+
+            yield self
+
+    @classmethod
+    def set_interning(cls, enabled=True):
+        """ reuse any live instance of cls with the same iri instead of
+            constructing a new one, instances are held by weak references
+            so interning does not keep anything alive
+
+            the table is emptied when cls._namespaces changes so that
+            prefix and suffix always match the current curies
+
+            subclasses are not affected, e.g. OntId.set_interning()
+            does not intern OntTerms, call it on each class to intern """
+        cls._intern = enabled
+        if not enabled and '_intern_table' in cls.__dict__:
+            del cls._intern_table
+
+    @classmethod
+    def _interned(cls):
+        try:
+            snapshot = cls._namespaces._snapshot
+        except AttributeError:
+            snapshot = cls._namespaces.freeze()
+
+        table = cls.__dict__.get('_intern_table')
+        if table is None or table[0] is not snapshot:
+            table = cls._intern_table = snapshot, weakref.WeakValueDictionary()
+
+        return table[1]
+
     @property
     def namespaces(self):
-        return self._namespaces()
+        return self._namespaces.mapping
 
     @namespaces.setter
     def namespaces(self, value):
@@ -392,7 +986,7 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
     @property
     def namespace(self):
         if self.prefix:
-            return self.namespaces[self.prefix]
+            return self._namespaces.mapping[self.prefix]
 
     @property
     def iprefix(self):
@@ -410,11 +1004,10 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
 
     @classmethod
     def _make_iri(cls, prefix, suffix):
-        namespaces = cls._namespaces()
-        if prefix in namespaces:
-            return namespaces[prefix] + suffix
-        else:
-            raise cls.UnknownPrefixError(f'Unknown curie prefix: {prefix} for {prefix}:{suffix}')
+        try:
+            return cls._namespaces.mapping[prefix] + suffix
+        except KeyError:
+            raise cls.UnknownPrefixError(f'Unknown curie prefix: {prefix} for {prefix}:{suffix}') from None
 
     @property
     def quoted(self):
@@ -431,30 +1024,63 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
             raise ValueError(f'{bads} are not valid repr args for {cls}')
         else:
             cls.repr_args = args
+            # the new default replaces any level or pending one shot
+            # override for cls in the current thread or task
+            for var in (_repr_args, _repr_oneshot, _repr_levels):
+                values = var.get()
+                if cls in values:
+                    var.set({k:v for k, v in values.items() if k is not cls})
 
     @classmethod
     def repr_level(cls, verbose=True):  # FIXMe naming
-        if not hasattr(cls, f'_{cls.__name__}__repr_level'):
-            setattr(cls, f'_{cls.__name__}__repr_level', 0)
-            #cls.__repr_level = 0 # how is this different....
-        current = getattr(cls, f'_{cls.__name__}__repr_level')
+        """ cycle through repr_arg_order for the current thread or task """
+        levels = _repr_levels.get()
+        current = levels.get(cls, 0)
         nargs = len(cls.repr_arg_order)
         next = (current + 1) % nargs
-        cls.repr_args = cls.repr_arg_order[next]
+        cls._set_context_repr_args(cls.repr_arg_order[next])
         if verbose:
-            log.info(f'{cls.__name__} will now repr with {cls.repr_args}')
-        setattr(cls, f'_{cls.__name__}__repr_level', next)
+            log.info(f'{cls.__name__} will now repr with {cls._current_repr_args()}')
+        _repr_levels.set({**levels, cls: next})
 
     @classmethod
     def set_next_repr(cls, *repr_args):
-        cls._oneshot_old_repr_args = cls.repr_args
-        cls.repr_args = repr_args
+        """ repr with repr_args until the next repr in the current
+            thread or task, other threads and tasks are not affected """
+        overrides = _repr_args.get()
+        _repr_oneshot.set({**_repr_oneshot.get(), cls: overrides.get(cls, _unset)})
+        _repr_args.set({**overrides, cls: repr_args})
 
     @classmethod
     def reset_repr_args(cls):
-        if hasattr(cls, '_oneshot_old_repr_args') and cls._oneshot_old_repr_args is not None:
-            cls.repr_args = cls._oneshot_old_repr_args
-            cls._oneshot_old_repr_args = None
+        oneshot = _repr_oneshot.get()
+        if cls in oneshot:
+            old = oneshot[cls]
+            _repr_oneshot.set({k:v for k, v in oneshot.items() if k is not cls})
+            overrides = {k:v for k, v in _repr_args.get().items() if k is not cls}
+            if old is not _unset:
+                overrides[cls] = old
+
+            _repr_args.set(overrides)
+
+    @classmethod
+    def _set_context_repr_args(cls, repr_args):
+        _repr_args.set({**_repr_args.get(), cls: repr_args})
+
+    @classmethod
+    def _current_repr_args(cls):
+        """ repr_args for the current thread or task, the class
+            attribute is the default for all threads and tasks """
+        overrides = _repr_args.get()
+        if overrides:
+            # resolve like the attribute would have been
+            for klass in cls.__mro__:
+                if klass in overrides:
+                    return overrides[klass]
+                elif 'repr_args' in klass.__dict__:
+                    break
+
+        return cls.repr_args
 
     @property
     def _repr_level(self):
@@ -472,7 +1098,7 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
         first_done = False
         #firsts = getattr(self.__class__, f'_{self.__class__.__name__}__firsts')
         firsts = self._firsts
-        for arg in self.__class__.repr_args:  # always use class repr args
+        for arg in self._current_repr_args():  # always use class repr args
             if not hasattr(self, arg) or getattr(self, arg) is None:  # allow repr of uninitialized classes
                 continue
             is_arg = False
@@ -502,24 +1128,60 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
         id_ = self.curie if hasattr(self, 'curie') else super().__repr__()
         return f"{self.__class__.__name__}('{id_}')"
 
+    @classmethod
+    def _repr_template(cls, args):
+        """ the format string for these args, the same as _repr_base """
+        template = cls._repr_templates.get((cls, args))
+        if template is None:
+            first_done = False
+            parts = []
+            for arg in args:
+                if not first_done and arg in cls._firsts:
+                    first_done = True
+                    parts.append('{}')
+                else:
+                    parts.append(arg + '={}')
+
+            template = cls.__name__ + '(' + ', '.join(parts) + ')'
+            cls._repr_templates[cls, args] = template
+
+        return template
+
     def __repr__(self):
         try:
-            rargs = self._repr_args
-            if not any(rargs.values()):
+            # one pass over repr_args, see _repr_include_args
+            args = []
+            values = []
+            for arg in self._current_repr_args():  # always use class repr args
+                value = getattr(self, arg, None)  # allow repr of uninitialized classes
+                if value is not None:
+                    args.append(arg)
+                    values.append(repr(value))
+
+            if hasattr(self, 'validated') and not self.validated:
+                args.append('validated')
+                values.append(repr(self.validated))
+
+            if not args:
                 return self.__class__.__name__ + f'({self.iri})'
 
-            out = self._repr_base.format(**rargs)
-            return out
+            return self._repr_template(tuple(args)).format(*values)
         finally:
             self.reset_repr_args()
 
     def __copy__(self):
+        if self._intern:
+            return self
+
         cls = self.__class__
         result = cls.__new__(cls, iri=self.iri)
         result.__dict__.update(self.__dict__)
         return result
 
     def __deepcopy__(self, memo):
+        if self._intern:
+            return self
+
         cls = self.__class__
         result = cls.__new__(cls, iri=self.iri)
         memo[id(self)] = result
@@ -528,6 +1190,95 @@ class OntId(Identifier, str):  # TODO all terms singletons to prevent nastyness
         return result
 
 
+class _ResultField:
+    """ An OntTerm field that reads through to the bound QueryResult so
+        that the value is not stored twice. Setting the field on a term
+        overrides the result until the next result is bound. """
+
+    def __init__(self, key=None):
+        self.key = key
+
+    def __set_name__(self, owner, name):
+        self.name = name
+        if self.key is None:
+            self.key = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        d = instance.__dict__
+        try:
+            return d[self.name]
+        except KeyError:
+            pass
+
+        try:
+            return getattr(d['_query_result'], self.key)
+        except KeyError:
+            pass
+
+        if instance._resolve_deferred():
+            try:
+                return getattr(d['_query_result'], self.key)
+            except KeyError:
+                if self.name in d:
+                    return d[self.name]
+
+        raise AttributeError(self.name)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+    def __delete__(self, instance):
+        try:
+            del instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+
+class _DeferredBatch:
+    """ Deferred terms that are resolved together by a BulkFetch
+        when any one of them is first used, see OntTerm.set_deferred.
+        Terms are held by weak references so that terms which are
+        never used are not kept alive waiting for a fetch. """
+
+    def __init__(self, query):
+        self.query = query
+        self._refs = []
+        self._lock = threading.RLock()
+
+    def add(self, term):
+        self._refs.append(weakref.ref(term))
+        term.__dict__['_batch'] = self
+
+    def resolve(self):
+        with self._lock:
+            refs, self._refs = self._refs, []
+            terms = [term for term in (ref() for ref in refs)
+                     if term is not None and term.__dict__.get('_batch') is self]
+            if not terms:
+                return
+
+            try:
+                BulkFetch(self.query).add(*terms).fetch()
+            except BaseException:
+                self._refs = refs + self._refs
+                raise
+
+            for term in terms:
+                term.__dict__.pop('_batch', None)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+
 class OntTerm(InstrumentedIdentifier, OntId):
     # TODO need a nice way to pass in the ontology query interface to the class at run time to enable dynamic repr if all information did not come back at the same time
     _valid_repr_args = OntId._valid_repr_args + ('label', 'synonyms', 'definition')
@@ -540,12 +1291,32 @@ class OntTerm(InstrumentedIdentifier, OntId):
                       ('iri', 'label', 'definition', 'curie'),
                       ('iri', 'label', 'definition'),)
 
-    _cache = {}
+    _cache = LRUCache()  # (query, iri) -> result, see set_cache
+
+    label = _ResultField()
+    labels = _ResultField()
+    definition = _ResultField()
+    synonyms = _ResultField()
+    deprecated = _ResultField()
+    _graph = _ResultField()
+    _blob = _ResultField()
+    _source = _ResultField('source')
+    _type = _ResultField('type')
+    _types = _ResultField('types')
+    # fields that are stored on the term instead
+    _overrides = 'label', 'labels', 'definition', 'synonyms', 'deprecated', '_graph', '_blob', '_source', '_type', '_types'
+    # stored fields that resolve a deferred term, see set_deferred
+    _deferred_fields = 'predicates', 'validated', '_query_result'
+    _deferred = False
+    _deferred_batch_size = 1000
+    _deferred_lock = threading.Lock()
 
     #__firsts = 'curie', 'iri'
 
     def __new__(cls, curie_or_iri=None, prefix=None, suffix=None, curie=None,
-                iri=None, **kwargs):
+                iri=None, *, cache=True, **kwargs):
+        """ cache=False skips the resolved term cache and queries
+            the services again, the new result replaces the cached one """
         self = super().__new__(cls,
                                curie_or_iri=curie_or_iri,
                                prefix=prefix,
@@ -553,21 +1324,119 @@ class OntTerm(InstrumentedIdentifier, OntId):
                                curie=curie,
                                iri=iri,
                                **kwargs)
+        if cache and not kwargs:
+            d = self.__dict__
+            if 'validated' in d or '_batch' in d:
+                return self  # interned and already bound or deferred
+            elif cls._deferred:
+                cls._defer(self)
+                return self
+
         kwargs['iri'] = self.iri
         kwargs['curie'] = self.curie
-        self._bind_result(**kwargs)
+        self._bind_result(cache=cache, **kwargs)
         return self
 
     def __init__(self, *args, **kwargs):
         pass
 
-    def _bind_result(self, **kwargs):
+    @classmethod
+    def set_deferred(cls, enabled=True, batch_size=1000):
+        """ construct terms from a bare curie or iri without querying,
+            for terms that are mostly used for their iri or curie
+
+            a deferred term is resolved on first access to any field
+            from the query result or to predicates or validated, terms
+            are deferred in batches of up to batch_size and using any
+            term in a batch resolves the whole batch with a BulkFetch
+
+            terms constructed with values to validate against, e.g.
+            label=, are always resolved immediately """
+        cls._deferred = enabled
+        cls._deferred_batch_size = batch_size
+        if not enabled and '_deferred_batch' in cls.__dict__:
+            del cls._deferred_batch
+
+    @classmethod
+    def _defer(cls, term):
+        with cls._deferred_lock:
+            batch = cls.__dict__.get('_deferred_batch')
+            if (batch is None or batch.query is not cls.query or
+                len(batch) >= cls._deferred_batch_size):
+                batch = cls._deferred_batch = _DeferredBatch(cls.query)
+
+            batch.add(term)
+
+    def _resolve_deferred(self):
+        """ resolve a deferred term and the rest of its batch,
+            False if the term was not deferred """
+        d = self.__dict__
+        batch = d.get('_batch')
+        if batch is None:
+            return False
+
+        batch.resolve()
+        if '_batch' in d:  # not in the batch, e.g. a copy
+            BulkFetch(batch.query).add(self).fetch()
+            d.pop('_batch', None)
+
+        return True
+
+    def __getattr__(self, name):
+        if name in self._deferred_fields and self._resolve_deferred():
+            try:
+                return self.__dict__[name]
+            except KeyError:
+                pass
+
+        return super().__getattr__(name)
+
+    @classmethod
+    def set_cache(cls, maxsize=2 ** 14, ttl=None):
+        """ keep up to maxsize resolved results for ttl seconds,
+            ttl=None never expires and maxsize=0 disables the cache
+
+            the cache is shared by all subclasses and is keyed on
+            the query as well as the iri so query_init never sees
+            results from the services it replaced """
+        cls._cache.configure(maxsize, ttl)
+
+    @classmethod
+    def cache_info(cls):
+        """ hits, misses, expired, maxsize, currsize, and ttl of the
+            resolved term cache """
+        return cls._cache.info()
+
+    @classmethod
+    def cache_clear(cls):
+        cls._cache.clear()
+
+    def _bind_result(self, cache=True, **kwargs):
+        # results for specific predicates or for terms that are
+        # expected to fail validation are not shared
+        cacheable = 'predicates' not in kwargs and kwargs.get('validated') != False
+        key = self.query, self.iri
+        result = self._cache.get(key) if cacheable and cache else None
         try:
-            result = self._get_query_result(**kwargs)
+            if result is None:
+                result = self._get_query_result(**kwargs)
+                if cacheable:
+                    self._cache.add(key, result)
+
             self._bind_query_result(result, **kwargs)
         except StopIteration:
-            self.validated = False
-            self.label = None  # the label attr should always be present even on failure
+            self._bind_failed()
+
+    def _bind_failed(self):
+        d = self.__dict__
+        d.pop('_batch', None)
+        if '_query_result' in d:
+            # a later fetch that finds nothing, e.g. because it only asked
+            # a subset of the services, does not unbind a term
+            return
+
+        self.validated = False
+        self.label = None  # the label attr should always be present even on failure
 
     def _get_query_result(self, **kwargs):
         extra_kwargs = {}
@@ -576,6 +1445,10 @@ class OntTerm(InstrumentedIdentifier, OntId):
         # can't gurantee that all endpoints work on the expanded iri
         #log.info(repr(self.asId()))
         results_gen = self.query(iri=self.iri, curie=self.curie, raw=True, **extra_kwargs)
+        return self._select_result(results_gen)
+
+    def _select_result(self, results_gen):
+        """ the first result with a label, warn if services disagree """
         i = None
         for i, result in enumerate(results_gen):
             if i > 0:
@@ -649,7 +1522,7 @@ class OntTerm(InstrumentedIdentifier, OntId):
                                      f'does not match {keyword}={result[keyword]!r}')
 
                 else:
-                    self.__class__.repr_args = 'curie', keyword
+                    self.set_next_repr('curie', keyword)
                     if 'validated' in kwargs and kwargs['validated'] == False:
                         raise ValueError(f'Unvalidated value {keyword}={orig_value!r} '
                                          f'does not match {keyword}={result[keyword]!r}')
@@ -662,15 +1535,16 @@ class OntTerm(InstrumentedIdentifier, OntId):
 
         for keyword, value in result.items():
             validate(keyword, value)
-            if keyword not in self._firsts:  # already managed by OntId
-                if keyword == 'source':  # FIXME the things i do in the name of documentability >_<
-                    keyword = '_source'
 
-                if keyword == 'predicates':
-                    value = self._normalize_predicates(value)
+        # everything other than the normalized predicates is
+        # read from the result so drop values from previous binds
+        d = self.__dict__
+        for keyword in self._overrides:
+            d.pop(keyword, None)
 
-                setattr(self, keyword, value)  # TODO value lists...
+        d.pop('_batch', None)
 
+        self.predicates = self._normalize_predicates(result.predicates)
         self.validated = True
         self._query_result = result
 
@@ -692,30 +1566,115 @@ class OntTerm(InstrumentedIdentifier, OntId):
         return {k:tuple(fix(e) for e in v) if isinstance(v, tuple) else fix(v)
                 for k, v in predicates.items()}
 
+    @classmethod
+    def _from_parts(cls, iri, prefix, suffix):
+        self = super()._from_parts(iri, prefix, suffix)
+        if _defer_bind.get():
+            pass
+        elif cls._deferred:
+            cls._defer(self)
+        else:
+            self._bind_result(iri=self.iri, curie=self.curie)
+
+        return self
+
+    @classmethod
+    def _from_iri(cls, iri):
+        self = super()._from_iri(iri)
+        if _defer_bind.get():
+            pass
+        elif cls._deferred:
+            cls._defer(self)
+        else:
+            self._bind_result(iri=self.iri, curie=self.curie)
+
+        return self
+
     @classmethod
     def _from_query_result(cls, result):
         self = super().__new__(cls, **result)
         self._bind_query_result(result)
         return self
 
-    def fetch(self, *service_names):  # TODO
-        """ immediately fetch the current term """
+    def fetch(self, *service_names):
+        """ immediately fetch the current term, skipping the cache
+
+            if service_names are given only services whose class
+            name is listed are queried, in their usual order """
+        services = None
+        if service_names:
+            services = tuple(s for s in self.query.services
+                             if s.__class__.__name__ in service_names)
+            missing = set(service_names) - {s.__class__.__name__ for s in services}
+            if missing:
+                raise ValueError(f'no services named {sorted(missing)} in {self.query}')
+
+        BulkFetch(self.query, services=services, cache=False).add(self).fetch()
+        return self
 
-    def fetch_with(self, query=None):  # TODO
-        """ add to a future bulk fetch """
+    def fetch_with(self, query=None):
+        """ add to a future bulk fetch, query is an OntQuery, in which
+            case the fetch runs on query.bulk_fetch(), or a BulkFetch """
         # depending on the nature of the services for the fetcher
         # and which ones are selected we can optimize to either
         # send a bunch of queries at the same time if the remote
         # side of the service doesn't support what we want, OR
-        # we can send a bulk query all at once, dealing with the
-        # rankings is a bit of a pain though
-        query.add_to_bulk_fetch(self)
+        # we can send a bulk query all at once, see BulkFetch
+        if query is None:
+            query = self.query
+
+        return query.add_to_bulk_fetch(self)
+
+    @classmethod
+    def fetch_many(cls, curies_or_iris, errors='raise', max_workers=8, cache=True):
+        """ construct terms for a column of curies or iris and resolve
+            them together, see from_many for errors and BulkFetch
+            for how the services are queried """
+        token = _defer_bind.get()
+        _defer_bind.set(True)
+        try:
+            terms = cls.from_many(curies_or_iris, errors=errors)
+        finally:
+            _defer_bind.set(token)
+
+        bulk = BulkFetch(cls.query, max_workers=max_workers, cache=cache)
+        bulk.add(*(term for term in terms if isinstance(term, cls) and
+                   (not cache or 'validated' not in term.__dict__)))
+        bulk.fetch()
+        return terms
 
     def debug(self):
         """ return debug information """
         if self._graph:
             print(self._graph.serialize(format='nifttl').decode())
 
+    def _predicates_as_terms(self, predicates, preferred=False):
+        """ convert the ids in the values of predicates to terms, the
+            ids from all predicates are resolved together, as are the
+            preferred ids if preferred is True """
+        cls = self.__class__
+        ids = list(dict.fromkeys(v for values in predicates.values() for v in values
+                                 if isinstance(v, OntId) and not isinstance(v, cls)))
+        terms = dict(zip(ids, cls.fetch_many([str(i) for i in ids])))
+        out = {k:tuple(terms.get(v, v) if isinstance(v, OntId) else v for v in values)
+               for k, values in predicates.items()}
+        if preferred:
+            all_terms = [t for values in out.values() for t in values if isinstance(t, cls)]
+            cls._prefetch_preferred(all_terms)
+            out = {k:tuple(t.asPreferred() if isinstance(t, cls) else t for t in values)
+                   for k, values in out.items()}
+
+        return out
+
+    @classmethod
+    def _prefetch_preferred(cls, terms):
+        """ resolve the preferred ids of terms together so that
+            asPreferred finds them in the cache """
+        preferred = [str(t.predicates['TEMP:preferredId'][0]) for t in terms
+                     if t.validated and 'TEMP:preferredId' in t.predicates]
+        if preferred:
+            cls.fetch_many(preferred)
+
     def asPreferred(self):
         """ Return the term attached to its preferred id """
         if not self.validated:
@@ -754,8 +1713,14 @@ class OntTerm(InstrumentedIdentifier, OntId):
             return self._source
 
     @classmethod
-    def search(cls, expression, prefix=None, filters=tuple(), limit=40):
-        """ Something that actually sort of works """
+    def search(cls, expression, prefix=None, filters=tuple(), limit=40, max_workers=8):
+        """ Something that actually sort of works
+
+            the labels and synonyms of each search hit that contain all
+            filters are looked up as terms and the distinct terms found
+            are returned sorted by label, hits are only resolved if the
+            search did not return their label, each distinct string is
+            only looked up once and the lookups run concurrently """
         OntTerm = cls
         if expression is None and prefix is not None:
             # FIXME bad convention
@@ -763,12 +1728,32 @@ class OntTerm(InstrumentedIdentifier, OntId):
                           for qr in OntTerm.query(search=expression,
                                                   prefix=prefix, limit=limit))
 
-        return sorted(set(next(OntTerm.query(term=s)).OntTerm
-                          for qr in OntTerm.query(search=expression,
-                                                  prefix=prefix, limit=limit)
-                          for s in chain(OntTerm(qr.iri).synonyms, (qr.label,))
-                          if all(f in s for f in filters)),
-                          key=lambda t:t.label)
+        hits = list(OntTerm.query(search=expression, prefix=prefix,
+                                  limit=limit, raw=True))
+        # search results usually carry their label and synonyms
+        # only go back to the services for the ones that don't
+        unlabeled = [hit.iri for hit in hits if not hit.label]
+        resolved = {t.iri:t for t in OntTerm.fetch_many(unlabeled, max_workers=max_workers)}
+        strings = {}  # ordered set
+        for hit in hits:
+            source = resolved.get(hit.iri, hit)
+            for s in chain(source.synonyms or tuple(), (source.label,)):
+                if s and all(f in s for f in filters):
+                    strings[s] = None
+
+        def first(s):
+            return next(OntTerm.query(term=s, raw=True), None)
+
+        if len(strings) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(strings))) as pool:
+                results = list(pool.map(first, strings))
+        else:
+            results = [first(s) for s in strings]
+
+        # many strings find the same term, only construct it once
+        by_iri = {result.iri:result for result in results if result is not None}
+        return sorted((result.asTerm() for result in by_iri.values()),
+                      key=lambda t:t.label or '')
 
     def __call__(self, predicate, *predicates, depth=1, direction='OUTGOING',
                  asTerm=False, asPreferred=False, include_supers=False):
@@ -790,17 +1775,14 @@ class OntTerm(InstrumentedIdentifier, OntId):
                 if not isinstance(v, tuple):
                     v = v,
 
-                if asTerm:
-                    v = tuple(self.__class__(v) if not isinstance(v, self.__class__) and isinstance(v, OntId)
-                              else v for v in v)
-                    if asPreferred:
-                        v = tuple(t.asPreferred() if isinstance(t, self.__class__) else t for t in v)
-
                 if k in out:
                     out[k] += v
                 else:
                     out[k] = v
 
+        if asTerm:
+            out = self._predicates_as_terms(out, asPreferred)
+
         if not hasattr(self, 'predicates'):
             self.predicates = {}
 
@@ -972,7 +1954,7 @@ class _OntTerm(OntTerm):
                     elif keyword == 'predicates':
                         pass  # query will not match result
                     else:
-                        self.__class__.repr_args = 'curie', keyword
+                        self.set_next_repr('curie', keyword)
                         if validated == False:
                             raise ValueError(f'Unvalidated value {keyword}={orig_value!r} '
                                              f'does not match {keyword}={result[keyword]!r}')
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+from functools import lru_cache
 from unicodedata import category
 
 NAME_START_CATEGORIES = ["Ll", "Lu", "Lo", "Lt", "Nl"]
@@ -7,17 +9,48 @@ ALLOWED_NAME_CHARS = ["\u00B7", "\u0387", "-", ".", "_", ":"]
 XMLNS = "http://www.w3.org/XML/1998/namespace"
 
 
+_category = lru_cache(maxsize=4096)(category)
+
+# every ascii character that can appear in a local name
+_ASCII_NAME_CHARS = ''.join(c for c in map(chr, range(128))
+                            if category(c) in NAME_CATEGORIES or
+                            c in ALLOWED_NAME_CHARS)
+# ascii name characters that cannot start the local name of a split
+_ASCII_NO_SPLIT_CHARS = ''.join(c for c in _ASCII_NAME_CHARS
+                                if category(c) not in SPLIT_START_CATEGORIES and
+                                c != '_')
+
+
 def split_uri(uri, split_start=SPLIT_START_CATEGORIES):
+    if split_start is not SPLIT_START_CATEGORIES:
+        return _split_uri(uri, split_start)
+
+    if uri.startswith(XMLNS):
+        return (XMLNS, uri.split(XMLNS)[1])
+
+    # ascii fast path, strip the trailing local name in one pass and
+    # only fall back to unicode categories when the character before
+    # it is not ascii or when there is nowhere to split after it
+    head = uri.rstrip(_ASCII_NAME_CHARS)
+    if head and head[-1] < '\x80':
+        ln = uri[len(head):].lstrip(_ASCII_NO_SPLIT_CHARS)
+        if ln:
+            return (uri[:len(uri) - len(ln)], ln)
+
+    return _split_uri(uri, split_start)
+
+
+def _split_uri(uri, split_start=SPLIT_START_CATEGORIES):
     if uri.startswith(XMLNS):
         return (XMLNS, uri.split(XMLNS)[1])
     length = len(uri)
     for i in range(0, length):
         c = uri[-i - 1]
-        if not category(c) in NAME_CATEGORIES:
+        if not _category(c) in NAME_CATEGORIES:
             if c in ALLOWED_NAME_CHARS:
                 continue
             for j in range(-1 - i, length):
-                if category(uri[j]) in split_start or uri[j] == "_":
+                if _category(uri[j]) in split_start or uri[j] == "_":
                     # _ prevents early split, roundtrip not generate
                     ns = uri[:j]
                     if not ns:
@@ -71,3 +104,72 @@ def get_namespaces(trie, value):
             for ns in get_namespaces(trie[key], value):
                 if ns is not None:
                     yield ns
+
+
+class NamespaceIndex:
+    """ Longest prefix matcher for namespaces.
+
+        Namespaces are bucketed by length so that a lookup probes
+        one hash per distinct namespace length that fits in the value.
+        The cost of a lookup depends on the length of the value, not
+        on the number of namespaces in the index. """
+
+    __slots__ = ('_namespaces', '_lengths')
+
+    def __init__(self, namespaces=tuple()):
+        self._namespaces = set(namespaces)
+        self._lengths = sorted(set(len(n) for n in self._namespaces))
+
+    def add(self, namespace):
+        if namespace not in self._namespaces:
+            self._namespaces.add(namespace)
+            length = len(namespace)
+            i = bisect_right(self._lengths, length)
+            if not i or self._lengths[i - 1] != length:
+                self._lengths.insert(i, length)
+
+    def update(self, namespaces):
+        """ add many namespaces, sorting the lengths once """
+        namespaces = set(namespaces) - self._namespaces
+        if namespaces:
+            self._namespaces.update(namespaces)
+            self._lengths = sorted(set(self._lengths).union(map(len, namespaces)))
+
+    def longest(self, value, min_length=0):
+        """ the longest namespace that is a prefix of value and is
+            at least min_length long, None if there is no match """
+        namespaces = self._namespaces
+        lengths = self._lengths
+        for i in range(bisect_right(lengths, len(value)) - 1, -1, -1):
+            length = lengths[i]
+            if length < min_length:
+                break
+
+            candidate = value[:length]
+            if candidate in namespaces:
+                return candidate
+
+    def namespaces(self, value):
+        """ all namespaces that are a prefix of value, shortest first """
+        namespaces = self._namespaces
+        return [value[:length] for length in
+                self._lengths[:bisect_right(self._lengths, len(value))]
+                if value[:length] in namespaces]
+
+    def copy(self):
+        new = self.__class__.__new__(self.__class__)
+        new._namespaces = set(self._namespaces)
+        new._lengths = list(self._lengths)
+        return new
+
+    def __contains__(self, namespace):
+        return namespace in self._namespaces
+
+    def __iter__(self):
+        yield from sorted(self._namespaces)
+
+    def __len__(self):
+        return len(self._namespaces)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(<{len(self)} namespaces>)'
@@ -1,5 +1,27 @@
+import time
 import logging
+import threading
 from functools import wraps
+from collections import namedtuple, OrderedDict
+
+try:
+    from contextvars import ContextVar
+except ImportError:  # python 3.6
+    class ContextVar:
+        """ thread local stand in for contextvars.ContextVar,
+            only supports get and set """
+
+        def __init__(self, name, *, default=None):
+            self.name = name
+            self._default = default
+            self._local = threading.local()
+
+        def get(self):
+            return getattr(self._local, 'value', self._default)
+
+        def set(self, value):
+            self._local.value = value
+
 
 red = '\x1b[31m{}\x1b[0m'
 
@@ -105,6 +127,135 @@ def mimicArgs(function_to_mimic):
     return decorator
 
 
+MemoInfo = namedtuple('MemoInfo', ['hits', 'misses', 'maxsize', 'currsize', 'generation'])
+
+
+class MemoCache:
+    """ A bounded memo with hit/miss counters. When the memo is full
+        the oldest entry is evicted. Consumers that read from memo
+        directly are responsible for incrementing hits and misses.
+        derived holds unbounded values that are only valid for the
+        current generation. """
+
+    def __init__(self, maxsize=2 ** 16, generation=0):
+        self.maxsize = maxsize
+        self.memo = {}
+        self.derived = {}
+        self.hits = 0
+        self.misses = 0
+        self.generation = generation
+
+    def add(self, key, value):
+        memo = self.memo
+        if len(memo) >= self.maxsize:
+            if self.maxsize <= 0:
+                return
+
+            try:
+                memo.pop(next(iter(memo)), None)
+            except (RuntimeError, StopIteration):
+                pass  # another thread changed the memo under us
+
+        memo[key] = value
+
+    def invalidate(self):
+        """ drop all entries and start a new generation """
+        self.memo.clear()
+        self.derived.clear()
+        self.generation += 1
+
+    def info(self):
+        return MemoInfo(self.hits, self.misses, self.maxsize,
+                        len(self.memo), self.generation)
+
+    def __len__(self):
+        return len(self.memo)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.info()})'
+
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'expired', 'maxsize', 'currsize', 'ttl'])
+
+
+class LRUCache:
+    """ A bounded least recently used cache with an optional time to live
+        in seconds. Expired entries count as misses and are dropped when
+        they are looked up or when they reach the end of the queue.
+        Safe to share between threads. """
+
+    def __init__(self, maxsize=2 ** 14, ttl=None, timer=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.timer = timer
+        self._data = OrderedDict()  # key -> (expires, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                expires, value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+
+            if expires is not None and expires <= self.timer():
+                del self._data[key]
+                self.expired += 1
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def add(self, key, value):
+        if self.maxsize <= 0:
+            return
+
+        expires = None if self.ttl is None else self.timer() + self.ttl
+        with self._lock:
+            data = self._data
+            data[key] = expires, value
+            data.move_to_end(key)
+            while len(data) > self.maxsize:
+                data.popitem(last=False)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._data.pop(key, (None, default))[1]
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def configure(self, maxsize, ttl):
+        """ change the limits, entries over maxsize are evicted now
+            and the new ttl applies to entries added from now on """
+        with self._lock:
+            self.maxsize = maxsize
+            self.ttl = ttl
+            while self._data and len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.expired,
+                         self.maxsize, len(self._data), self.ttl)
+
+    def __contains__(self, key):
+        # does not count as a lookup and does not check expiry
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.info()})'
+
+
 class Graph():
     """ I can be pickled! And I can be loaded from a pickle dumped from a graph loaded via rdflib. """
     def __init__(self, triples=tuple()):
@@ -134,9 +285,15 @@ class QueryResult:
         of how a particular service maps their result terminology onto the
         ontquery keyword api. """
 
+    _fields = ('iri', 'curie', 'label', 'labels', 'definition', 'synonyms',
+               'deprecated', 'predicates', 'type', 'types', '_graph', '_blob',
+               'source')
+    # each field is stored exactly once, OntTerm reads through to them
+    __slots__ = ('__query_args',) + _fields
+
     @classmethod
     def new_from_instrumented(cls, instrumented):
-        return type(cls.__name__, (cls,), dict(_instrumented=instrumented))
+        return type(cls.__name__, (cls,), dict(_instrumented=instrumented, __slots__=()))
 
     def __init__(self,
                  query_args,
@@ -159,27 +316,22 @@ class QueryResult:
                  source=None,
     ):
         self.__query_args = query_args  # for debug
-        self.__dict = {}
-        for k, v in dict(iri=iri,
-                         curie=curie,
-                         label=label,
-                         labels=labels,
-                         definition=definition,
-                         synonyms=synonyms,
-                         deprecated=deprecated,
-                         predicates=predicates,
-                         type=type,
-                         types=types,
-                         _graph=_graph,
-                         _blob=_blob,
-                         source=source).items():
-            # this must return the empty values for all keys
-            # so that users don't have to worry about hasattring
-            # to make sure they aren't about to step into a typeless void
-
-            setattr(self, k, v)
-            self.__dict[k] = v
-            #self.__dict__[k] = v
+        # this must set the empty values for all fields
+        # so that users don't have to worry about hasattring
+        # to make sure they aren't about to step into a typeless void
+        self.iri = iri
+        self.curie = curie
+        self.label = label
+        self.labels = labels
+        self.definition = definition
+        self.synonyms = synonyms
+        self.deprecated = deprecated
+        self.predicates = predicates
+        self.type = type
+        self.types = types
+        self._graph = _graph
+        self._blob = _blob
+        self.source = source
 
     @property
     def OntTerm(self):  # FIXME naming XXXX deprecate this
@@ -196,25 +348,27 @@ class QueryResult:
         return hasattr(self, '_instrumented')
 
     def keys(self):
-        yield from self.__dict.keys()
+        yield from self._fields
 
     def values(self):
-        yield from self.__dict.values()
+        for field in self._fields:
+            yield getattr(self, field)
 
     def items(self):
-        yield from self.__dict.items()
+        for field in self._fields:
+            yield field, getattr(self, field)
 
     def __iter__(self):
-        yield from self.__dict
+        yield from self._fields
 
     def __getitem__(self, key):
-        try:
-            return self.__dict[key]
-        except KeyError as e:
-            self.__missing__(key, e)
+        if key in self._fields:
+            return getattr(self, key)
+
+        self.__missing__(key)
 
     def __contains__(self, key):
-        return key in self.__dict
+        return key in self._fields
 
     def __missing__(self, key, e=None):
         raise KeyError(f'{key} {type(key)}') from e
@@ -223,4 +377,4 @@ class QueryResult:
         raise ValueError('Cannot set results of a query.')
 
     def __repr__(self):
-        return f'{self.__class__.__name__}({self.__dict!r})'
+        return f'{self.__class__.__name__}({dict(self.items())!r})'
@@ -0,0 +1,922 @@
+""" Offline benchmarks for the identifier layer.
+
+    python -m test.benchmark [--json out.json] [--compare old.json] [--quick] [names ...]
+
+    The NIFSTD prefix map is used when pyontutils is installed, synthetic
+    maps with the same shape are used otherwise, nothing touches the network.
+    Results are seconds per call unless a benchmark says otherwise. """
+import os
+import sys
+import json
+import platform
+import pickle
+import random
+import tempfile
+import threading
+import time
+import timeit
+import tracemalloc
+from itertools import chain
+import ontquery as oq
+from ontquery import trie
+
+
+def synthetic_namespaces(count, seed=0):
+    """ namespaces shaped like the ones in the NIFSTD curie map, a mix of
+        per host namespaces and obo style namespaces nested under them """
+    rand = random.Random(seed)
+    hosts = max(int(count ** 0.5), 1)
+    out = []
+    for i in range(count):
+        host = f'http://ns{i % hosts}.example.org/'
+        if i < hosts:
+            out.append(host)
+        else:
+            name = ''.join(rand.choice('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+                           for _ in range(rand.randint(2, 8)))
+            out.append(f'{host}obo/{name}{i}_')
+
+    return out
+
+
+def timeper(function, number):
+    """ best of three, in seconds per call """
+    return min(timeit.repeat(function, number=number, repeat=3)) / number
+
+
+def bench_namespace_index(sizes=(100, 1000, 10000), lookups=1000):
+    """ longest namespace lookup, nested dict trie vs NamespaceIndex """
+    results = {}
+    for size in sizes:
+        namespaces = synthetic_namespaces(size)
+        rand = random.Random(size)
+        values = [rand.choice(namespaces) + '0000955' for _ in range(lookups)]
+
+        dict_trie = {}
+        for namespace in namespaces:
+            trie.insert_trie(dict_trie, namespace)
+
+        index = trie.NamespaceIndex(namespaces)
+
+        for value in values:
+            assert trie.get_longest_namespace(dict_trie, value) == index.longest(value)
+
+        def old():
+            for value in values:
+                trie.get_longest_namespace(dict_trie, value)
+
+        def new():
+            for value in values:
+                index.longest(value)
+
+        results[size] = {'dict_trie': timeper(old, 10) / lookups,
+                         'namespace_index': timeper(new, 10) / lookups}
+
+    return results
+
+
+def synthetic_curies(count, seed=0):
+    return {f'p{i}': namespace for i, namespace in
+            enumerate(synthetic_namespaces(count, seed=seed))}
+
+
+def nifstd_curies():
+    """ the NIFSTD curie map if it is available, synthetic otherwise """
+    try:
+        from pyontutils.namespaces import PREFIXES
+        return 'nifstd', dict(PREFIXES)
+    except ModuleNotFoundError:
+        try:
+            from ontquery.plugins.namespaces.nifstd import CURIE_MAP
+            return 'nifstd', dict(CURIE_MAP)
+        except ModuleNotFoundError:
+            return 'synthetic', synthetic_curies(300)
+
+
+def curie_maps():
+    name, curies = nifstd_curies()
+    return {name: curies, 'synthetic_3000': synthetic_curies(3000)}
+
+
+def sample_iris(curies, count, seed=0):
+    """ iris in the registered namespaces with obo style numeric suffixes """
+    rand = random.Random(seed)
+    namespaces = sorted(set(curies.values()))
+    return [rand.choice(namespaces) + f'{i:07}' for i in range(count)]
+
+
+def bench_qname(count=5000):
+    """ OntCuries.qname for iris that are in the memo and iris that are not """
+    results = {}
+    for name, curies in curie_maps().items():
+        OntCuries = oq.OntCuries.new()
+        OntCuries(curies)
+        iris = sample_iris(curies, count)
+        snapshot = OntCuries.freeze()
+
+        def hot():
+            for iri in iris:
+                OntCuries.qname(iri)
+
+        def cold():
+            for iri in iris:
+                snapshot._qname(iri)
+
+        hot()
+        results[name] = {'memo': timeper(hot, 5) / count,
+                         'no_memo': timeper(cold, 3) / count}
+
+    return results
+
+
+def bench_ontid(count=2000):
+    """ OntId from a curie, from an iri, and from prefix= suffix=
+
+        curie_cold registers a prefix before each pass so that every
+        curie misses the memos, as it does the first time it is seen """
+    results = {}
+    for name, curies in curie_maps().items():
+        OntCuries = oq.OntCuries.new()
+        OntCuries(curies)
+        OntId = type('OntId', (oq.OntId,), dict(_namespaces=OntCuries))
+        iris = [i for i in sample_iris(curies, count)
+                if OntCuries.qname(i) != i]
+        pairs = [OntCuries.qname(i).split(':', 1) for i in iris]
+        curies_ = [':'.join(pair) for pair in pairs]
+
+        def from_curie():
+            for curie in curies_:
+                OntId(curie)
+
+        generations = iter(range(10 ** 9))
+
+        def from_curie_cold():
+            OntCuries({'cold': f'http://cold.example.org/{next(generations)}/'})
+            for curie in curies_:
+                OntId(curie)
+
+        def from_iri():
+            for iri in iris:
+                OntId(iri)
+
+        def from_prefix_suffix():
+            for prefix, suffix in pairs:
+                OntId(prefix=prefix, suffix=suffix)
+
+        def from_many():
+            OntId.from_many(curies_)
+
+        LazyOntId = type('OntId', (OntId,), dict(_lazy=True))
+
+        def from_iri_lazy():
+            for iri in iris:
+                LazyOntId(iri)
+
+        results[name] = {n: timeper(f, 3) / len(iris) for n, f in
+                         (('curie', from_curie), ('curie_cold', from_curie_cold),
+                          ('iri', from_iri),
+                          ('prefix_suffix', from_prefix_suffix),
+                          ('from_many', from_many),
+                          ('iri_lazy', from_iri_lazy))}
+
+    return results
+
+
+def bench_identifier_prefixes(count=2000):
+    """ identifier_prefixes from an iri, a curie, and a prefix, the
+        first call after a registration pays to build the index """
+    results = {}
+    for name, curies in curie_maps().items():
+        OntCuries = oq.OntCuries.new()
+        OntCuries(curies)
+        iris = [i for i in sample_iris(curies, count)
+                if OntCuries.qname(i) != i]
+        curies_ = [OntCuries.qname(i) for i in iris]
+        prefixes = [c.split(':', 1)[0] for c in curies_]
+
+        snapshot = OntCuries.freeze()
+
+        def build():
+            # a fresh snapshot has an empty memo so the index is rebuilt
+            fresh = type(snapshot)(snapshot._dict, snapshot._n_to_p, snapshot._trie)
+            fresh.identifier_prefixes(iris[0])
+
+        def run(values):
+            def inner():
+                for value in values:
+                    OntCuries.identifier_prefixes(value)
+            return inner
+
+        results[name] = {'first_call': timeper(build, 3),
+                         **{n: timeper(run(v), 3) / len(v) for n, v in
+                            (('iri', iris), ('curie', curies_), ('prefix', prefixes))}}
+
+    return results
+
+
+def bench_many(size=1000, items=100000, distinct=5000):
+    """ per item qname and expansion vs qname_many and expand_many """
+    curies = synthetic_curies(size)
+    OntCuries = oq.OntCuries.new()
+    OntCuries(curies)
+    OntId = type('OntId', (oq.OntId,), dict(_namespaces=OntCuries))
+    rand = random.Random(size)
+    prefixes = list(curies)
+    pool = [f'{rand.choice(prefixes)}:{i}' for i in range(distinct)]
+    column_curies = [rand.choice(pool) for _ in range(items)]
+    column_iris = OntCuries.expand_many(column_curies)
+
+    def qname_each():
+        return [OntCuries.qname(iri) for iri in column_iris]
+
+    def qname_many():
+        return OntCuries.qname_many(column_iris)
+
+    def expand_each():
+        return [OntId._make_iri(*curie.split(':', 1)) for curie in column_curies]
+
+    def expand_many():
+        return OntCuries.expand_many(column_curies)
+
+    assert qname_each() == qname_many() == column_curies
+    assert expand_each() == expand_many()
+    return {name: timeper(function, 1) / items for name, function in
+            (('qname_each', qname_each), ('qname_many', qname_many),
+             ('expand_each', expand_each), ('expand_many', expand_many))}
+
+
+def bench_split_uri(count=10000):
+    """ table driven split_uri vs the unicode category scan """
+    rand = random.Random(count)
+    namespaces = synthetic_namespaces(1000)
+    iris = [rand.choice(namespaces) + f'{i:07}' for i in range(count)]
+
+    def scan():
+        for iri in iris:
+            trie._split_uri(iri)
+
+    def table():
+        for iri in iris:
+            trie.split_uri(iri)
+
+    return {'category_scan': timeper(scan, 3) / count,
+            'split_uri': timeper(table, 3) / count}
+
+
+def bench_registration(sizes=(100, 1000, 3000)):
+    """ time to register a prefix map, one prefix per call vs one call,
+        legacy is the per call dict trie insert and _pn sort that
+        OntCuries.__new__ used to do, in seconds per map """
+    name, nifstd = nifstd_curies()
+    maps = {name: nifstd, **{size: synthetic_curies(size) for size in sizes}}
+    results = {}
+    for size, curies in maps.items():
+
+        def legacy():
+            dict_trie, d = {}, {}
+            for p, namespace in curies.items():
+                trie.insert_trie(dict_trie, namespace)
+                d[p] = namespace
+                sorted(d.items(), key=lambda kv: len(kv[1]), reverse=True)
+
+        def incremental():
+            OntCuries = oq.OntCuries.new()
+            for p, namespace in curies.items():
+                OntCuries({p: namespace})
+
+        def bulk():
+            OntCuries = oq.OntCuries.new()
+            OntCuries(curies)
+
+        results[size] = {name: timeper(function, 1) for name, function in
+                         (('legacy', legacy), ('incremental', incremental), ('bulk', bulk))}
+
+    return results
+
+
+def bench_snapshot(size=3000):
+    """ worker startup, register a pickled prefix map vs load a snapshot """
+    curies = synthetic_curies(size)
+    OntCuries = oq.OntCuries.new()
+    OntCuries(curies)
+    with tempfile.TemporaryDirectory() as tmp:
+        mapping_path = os.path.join(tmp, 'curies.pickle')
+        snapshot_path = os.path.join(tmp, 'snapshot.pickle')
+        with open(mapping_path, 'wb') as f:
+            pickle.dump(curies, f)
+
+        OntCuries.freeze().dump(snapshot_path)
+
+        def rebuild():
+            with open(mapping_path, 'rb') as f:
+                oq.OntCuries.new()(pickle.load(f))
+
+        def snapshot():
+            oq.OntCuries.new().load_snapshot(snapshot_path)
+
+        return {'rebuild': timeper(rebuild, 5), 'load_snapshot': timeper(snapshot, 5)}
+
+
+def bench_ontid_curie(number=20000):
+    """ OntId('UBERON:0000955') with the curie map accessor vs the
+        previous OntCuries.__new__ round trip in _make_iri """
+    OntCuries = oq.OntCuries.new()
+    OntCuries({'UBERON': 'http://purl.obolibrary.org/obo/UBERON_'})
+
+    class Legacy(oq.OntId):
+        _namespaces = OntCuries
+
+        @classmethod
+        def _make_iri(cls, prefix, suffix):
+            namespaces = cls._namespaces()
+            if prefix in namespaces:
+                return namespaces[prefix] + suffix
+            else:
+                raise cls.UnknownPrefixError(prefix)
+
+    class OntId(oq.OntId):
+        _namespaces = OntCuries
+
+    assert Legacy('UBERON:0000955') == OntId('UBERON:0000955')
+    return {'legacy': timeper(lambda: Legacy('UBERON:0000955'), number),
+            'mapping': timeper(lambda: OntId('UBERON:0000955'), number)}
+
+
+def bench_threads(threads=(1, 2, 4, 8), size=1000, items=20000):
+    """ aggregate qname throughput with readers sharing one OntCuries
+        while a writer keeps publishing new snapshots, in calls per second """
+    curies = synthetic_curies(size)
+    rand = random.Random(size)
+    prefixes = list(curies)
+    iris = [curies[rand.choice(prefixes)] + f'{i:07}' for i in range(items)]
+    results = {}
+    for count in threads:
+        OntCuries = oq.OntCuries.new()
+        OntCuries(curies)
+        done = threading.Event()
+
+        def read():
+            qname = OntCuries.qname
+            for iri in iris:
+                qname(iri)
+
+        def write():
+            i = 0
+            while not done.wait(0.001):
+                OntCuries({f'writer{i}': f'http://writer.example.org/{i}/'})
+                i += 1
+
+        readers = [threading.Thread(target=read) for _ in range(count)]
+        writer = threading.Thread(target=write)
+        writer.start()
+        start = timeit.default_timer()
+        for reader in readers:
+            reader.start()
+
+        for reader in readers:
+            reader.join()
+
+        elapsed = timeit.default_timer() - start
+        done.set()
+        writer.join()
+        results[count] = count * items / elapsed
+
+    return results
+
+
+def bench_intern(edges=1000000, nodes=20000):
+    """ build OntId pairs for an edge list the way the services do,
+        seconds per edge and retained bytes per edge with and without
+        interning, all ids stay alive like they do in predicates """
+    name, curies = nifstd_curies()
+    OntCuries = oq.OntCuries.new()
+    OntCuries(curies)
+    rand = random.Random(edges)
+    pool = [OntCuries.qname(i) for i in sample_iris(curies, nodes)]
+    pool = [c for c in pool if ':' in c and '://' not in c]
+    edge_list = [(rand.choice(pool), rand.choice(pool)) for _ in range(edges)]
+    results = {}
+    for intern in (False, True):
+        OntId = type('OntId', (oq.OntId,), dict(_namespaces=OntCuries))
+        OntId.set_interning(intern)
+
+        def build():
+            return [(OntId(s), OntId(o)) for s, o in edge_list]
+
+        start = timeit.default_timer()
+        built = build()
+        elapsed = timeit.default_timer() - start
+        del built
+        tracemalloc.start()
+        built = build()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del built
+        results['intern' if intern else 'no_intern'] = {'seconds': elapsed / edges,
+                                                        'bytes': size / edges}
+
+    return results
+
+
+def bench_memory(count=20000):
+    """ bytes per OntId, per QueryResult, and per OntTerm bound
+        to a QueryResult, not counting the result """
+    from ontquery.utils import QueryResult
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)  # OntTerm uses the default curies
+    iris = [i for i in sample_iris(curies, count) if oq.OntCuries.qname(i) != i]
+    QueryResult = QueryResult.new_from_instrumented(oq.OntTerm)
+
+    def size(function):
+        tracemalloc.start()
+        try:
+            built = function()
+            return tracemalloc.get_traced_memory()[0] / len(iris)
+        finally:
+            tracemalloc.stop()
+
+    def results():
+        return [QueryResult({'iri': iri}, iri=iri, curie=oq.OntCuries.qname(iri),
+                            label=f'label {i}', labels=(f'label {i}',),
+                            definition=f'definition {i}', synonyms=(f'synonym {i}',),
+                            predicates={}, source=None)
+                for i, iri in enumerate(iris)]
+
+    built = results()
+    LazyOntId = type('OntId', (oq.OntId,), dict(_lazy=True))
+    return {'OntId': size(lambda: [oq.OntId(iri) for iri in iris]),
+            'OntId_lazy': size(lambda: [LazyOntId(iri) for iri in iris]),
+            'QueryResult': size(results),
+            'OntTerm': size(lambda: [result.asTerm() for result in built])}
+
+
+def bench_normalize_predicates(objects=500):
+    """ OntTerm._normalize_predicates for a term with many predicate
+        objects, with the cached class resolution and with the mro walk
+        and subclass scan that used to run for every object """
+    from ontquery.utils import QueryResult
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)
+    iris = [i for i in sample_iris(curies, objects) if oq.OntCuries.qname(i) != i]
+    ids = tuple(oq.OntId(iri) for iri in iris)
+    terms = tuple(oq.OntTerm._from_query_result(
+        QueryResult.new_from_instrumented(oq.OntTerm)({}, iri=iri, predicates={}))
+                  for iri in iris[:len(iris) // 5])
+    predicates = {'rdfs:subClassOf': ids[:len(ids) // 2],
+                  'ilxtr:hasPart': ids[len(ids) // 2:] + terms,
+                  'TEMP:preferredId': ids[0]}
+    term = terms[0]
+    count = sum(len(v) if isinstance(v, tuple) else 1 for v in predicates.values())
+
+    def cached():
+        term._normalize_predicates(predicates)
+
+    def uncached():
+        try:
+            oq.OntTerm._instrumented_class = classmethod(
+                lambda cls: cls._find_instrumented_class())
+            oq.OntTerm._uninstrumented_class = classmethod(
+                lambda cls: cls._find_uninstrumented_class())
+            term._normalize_predicates(predicates)
+        finally:
+            del oq.OntTerm._instrumented_class
+            del oq.OntTerm._uninstrumented_class
+
+    return {'objects': count,
+            'uncached': timeper(uncached, 3),
+            'cached': timeper(cached, 3)}
+
+
+def bench_identifier_sets(count=1000000):
+    """ set and dict operations over OntIds, seconds per identifier, with
+        the previous Identifier.__eq__ and __hash__ and the current ones """
+    name, curies = nifstd_curies()
+    OntCuries = oq.OntCuries.new()
+    OntCuries(curies)
+    iris = sample_iris(curies, count)
+
+    class Legacy(oq.OntId):
+        _namespaces = OntCuries
+        _lazy = True
+
+        def __hash__(self):
+            return hash((self.__class__, super(oq.OntId, self).__hash__()))
+
+        def __eq__(self, other):
+            def complex_type_compare(a, b):
+                aii = isinstance(a, oq.terms.InstrumentedIdentifier)
+                bii = isinstance(b, oq.terms.InstrumentedIdentifier)
+                return aii and bii or (not aii and not bii)
+
+            if type(self) == type(other) or complex_type_compare(self, other):
+                return str(self) == str(other)
+            else:
+                return False
+
+    OntId = type('OntId', (oq.OntId,), dict(_namespaces=OntCuries, _lazy=True))
+    results = {}
+    for name, cls in (('legacy', Legacy), ('current', OntId)):
+        ids = cls.from_many(iris)
+        # equal but not identical so lookups have to call __eq__
+        probes = cls.from_many(iris)
+        start = timeit.default_timer()
+        as_set = set(ids)
+        built = timeit.default_timer()
+        assert all(probe in as_set for probe in probes)
+        looked_up = timeit.default_timer()
+        as_dict = dict.fromkeys(ids)
+        assert all(as_dict[probe] is None for probe in probes)
+        done = timeit.default_timer()
+        results[name] = {'set': (built - start) / count,
+                         'in': (looked_up - built) / count,
+                         'dict': (done - looked_up) / count}
+
+    return results
+
+
+def synthetic_terms(count):
+    """ OntTerms bound to synthetic QueryResults, no services needed """
+    from ontquery.utils import QueryResult
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)  # OntTerm uses the default curies
+    iris = [i for i in sample_iris(curies, count) if oq.OntCuries.qname(i) != i]
+    QueryResult = QueryResult.new_from_instrumented(oq.OntTerm)
+    return [QueryResult({'iri': iri}, iri=iri, curie=oq.OntCuries.qname(iri),
+                        label=f'label {i}', labels=(f'label {i}',),
+                        definition=f'definition {i}', synonyms=(f'synonym {i}',),
+                        predicates={}, source=None).asTerm()
+            for i, iri in enumerate(iris)]
+
+
+def bench_repr(count=100000):
+    """ repr of OntTerms with the default repr args, seconds per term """
+    terms = synthetic_terms(count)
+
+    def legacy():
+        for term in terms:
+            try:
+                term._repr_base.format(**term._repr_args)
+            finally:
+                term.reset_repr_args()
+
+    def current():
+        for term in terms:
+            repr(term)
+
+    return {'legacy': timeper(legacy, 1) / len(terms),
+            'current': timeper(current, 1) / len(terms)}
+
+
+def bench_term_cache(count=500):
+    """ OntTerm construction against a local rdflib service, seconds per
+        term, querying every time and hitting the resolved term cache """
+    import rdflib
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)
+    iris = [i for i in sample_iris(curies, count) if oq.OntCuries.qname(i) != i]
+    graph = rdflib.Graph()
+    for i, iri in enumerate(iris):
+        graph.add((rdflib.URIRef(iri), rdflib.RDF.type, rdflib.OWL.Class))
+        graph.add((rdflib.URIRef(iri), rdflib.RDFS.label, rdflib.Literal(f'label {i}')))
+
+    Term = oq.OntTerm
+    query = Term.__dict__.get('query')
+    Term.query_init(oq.plugin.get('rdflib')(graph))
+
+    def uncached():
+        for iri in iris:
+            Term(iri, cache=False)
+
+    def cached():
+        for iri in iris:
+            Term(iri)
+
+    try:
+        return {'uncached': timeper(uncached, 1) / len(iris),
+                'cached': timeper(cached, 1) / len(iris)}
+    finally:
+        if query is not None:
+            Term.query = query
+
+
+def bench_bulk_fetch(count=500, latency=0.002, max_workers=8):
+    """ resolving a column of curies against a service with simulated
+        network latency, seconds per term, one at a time, with
+        OntTerm.fetch_many, and by using one of a batch of deferred
+        terms, none of them use the resolved term cache """
+    import rdflib
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)
+    iris = [i for i in sample_iris(curies, count) if oq.OntCuries.qname(i) != i]
+    graph = rdflib.Graph()
+    for i, iri in enumerate(iris):
+        graph.add((rdflib.URIRef(iri), rdflib.RDF.type, rdflib.OWL.Class))
+        graph.add((rdflib.URIRef(iri), rdflib.RDFS.label, rdflib.Literal(f'label {i}')))
+
+    class Remote(oq.plugin.get('rdflib')):
+        batches = False
+
+        def query(self, *args, **kwargs):
+            time.sleep(latency)
+            yield from super().query(*args, **kwargs)
+
+    Term = oq.OntTerm
+    query = Term.__dict__.get('query')
+    Term.query_init(Remote(graph))
+
+    def serial():
+        for iri in iris:
+            Term(iri, cache=False)
+
+    def bulk():
+        Term.fetch_many(iris, max_workers=max_workers, cache=False)
+
+    def deferred():
+        Term.cache_clear()
+        Term.set_deferred(batch_size=len(iris))
+        try:
+            terms = [Term(iri) for iri in iris]
+        finally:
+            Term.set_deferred(False)
+
+        [term.label for term in terms]
+
+    try:
+        return {'serial': timeper(serial, 1) / len(iris),
+                'bulk': timeper(bulk, 1) / len(iris),
+                'deferred': timeper(deferred, 1) / len(iris)}
+    finally:
+        if query is not None:
+            Term.query = query
+
+
+class SearchService(oq.services.OntService):
+    """ an in memory service for search, term, and identifier
+        queries that counts calls and simulates network latency """
+
+    def __init__(self, records, latency=0):
+        self.records = records  # iri -> (label, synonyms)
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+        super().__init__()
+
+    @property
+    def predicates(self):
+        return tuple()
+
+    def _result(self, iri):
+        label, synonyms = self.records[iri]
+        return self.QueryResult(query_args={}, iri=iri, curie=oq.OntCuries.qname(iri),
+                                label=label, labels=(label,), synonyms=synonyms,
+                                predicates={}, source=self)
+
+    def query(self, iri=None, curie=None, term=None, search=None, limit=10, **kwargs):
+        with self._lock:
+            self.calls += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if iri is not None:
+            if iri in self.records:
+                yield self._result(iri)
+        elif search is not None:
+            hits = [i for i, (l, _) in self.records.items() if search in l]
+            for iri in hits[:limit]:
+                yield self._result(iri)
+        elif term is not None:
+            for iri, (label, synonyms) in self.records.items():
+                if term == label or term in synonyms:
+                    yield self._result(iri)
+
+
+def bench_search(count=1000, hits=40, latency=0.001):
+    """ OntTerm.search for a term with many hits against a service with
+        simulated latency, seconds per search and number of service
+        calls, resolving each hit and looking up every label and
+        synonym one at a time, and the current batched search """
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)
+    iris = [i for i in sample_iris(curies, count) if oq.OntCuries.qname(i) != i]
+    # neighbouring records share synonyms, every hits'th label matches
+    records = {iri: (f'{"brain " if not i % (len(iris) // hits) else ""}label {i}',
+                     (f'synonym {i}', f'synonym {i // 2}', f'shared {i % 7}'))
+               for i, iri in enumerate(iris)}
+    service = SearchService(records, latency=latency)
+    Term = oq.OntTerm
+    query = Term.__dict__.get('query')
+    Term.query_init(service)
+
+    def legacy():
+        return sorted(set(next(Term.query(term=s, raw=True)).asTerm()
+                          for qr in Term.query(search='brain', limit=hits, raw=True)
+                          for s in chain(Term(qr.iri, cache=False).synonyms, (qr.label,))),
+                      key=lambda t:t.label)
+
+    def current():
+        return Term.search('brain', limit=hits)
+
+    results = {}
+    try:
+        for name, function in (('legacy', legacy), ('current', current)):
+            Term.cache_clear()
+            service.calls = 0
+            start = timeit.default_timer()
+            out = function()
+            results[name] = {'seconds': timeit.default_timer() - start,
+                             'calls': service.calls}
+            results[name + '_terms'] = out
+
+        assert results.pop('legacy_terms') == results.pop('current_terms')
+        return results
+    finally:
+        if query is not None:
+            Term.query = query
+
+
+def bench_predicates(predicates=12, objects=20, latency=0.002, max_workers=8):
+    """ retrieving many predicates for a term from a SciGraphRemote whose
+        client is stubbed out with simulated latency, seconds per call,
+        one predicate and one object at a time, and concurrently with
+        the objects converted to terms in batch """
+    from ontquery.plugins.services.scigraph import SciGraphRemote
+    name, curies = nifstd_curies()
+    oq.OntCuries(curies)
+    iris = [i for i in sample_iris(curies, predicates * 2 + objects * 2 + 1)
+            if oq.OntCuries.qname(i) != i]
+    curie_list = [oq.OntCuries.qname(i) for i in iris]
+    subject = curie_list[0]
+    preds = curie_list[1:predicates + 1]
+    objs = curie_list[predicates + 1:predicates + objects + 1]
+
+    def wait():
+        if latency:
+            time.sleep(latency)
+
+    class Vocabulary:
+        def findById(self, identifier):
+            wait()
+            return {'iri': identifier.iri, 'curie': identifier.curie,
+                    'labels': [f'label {identifier.curie}'], 'definitions': [],
+                    'synonyms': [], 'deprecated': False, 'acronyms': [],
+                    'abbreviations': [], 'categories': []}
+
+    class Graph:
+        def getNeighbors(self, subject, relationshipType=None, **kwargs):
+            wait()
+            pred = getattr(relationshipType, 'curie', relationshipType)
+            return {'edges': [{'sub': subject.curie, 'pred': pred, 'obj': obj, 'meta': {}}
+                              for obj in objs]}
+
+        def getNode(self, identifier):
+            return {'nodes': [{'meta': {'types': ['Class']}}]}
+
+    class Remote(SciGraphRemote):
+        # every other predicate has an inverse so costs two round trips
+        known_inverses = tuple(zip(preds[::2], preds[1::2]))
+
+        def setup(self, **kwargs):
+            self.sgv, self.sgg = Vocabulary(), Graph()
+            self.curies = self._remote_curies = oq.OntCuries
+            self.prefixes = self.search_prefixes = sorted(oq.OntCuries)
+            self.categories = []
+            self._predicates = preds
+            return oq.services.OntService.setup(self, **kwargs)
+
+    Term = oq.OntTerm
+    query = Term.__dict__.get('query')
+    service = Remote()
+    Term.query_init(service)
+
+    def sequential():
+        Term.cache_clear()
+        service.max_workers = 1
+        term = Term(subject)
+        out = term(*preds)
+        return {k:tuple(Term(v, cache=False) for v in vs) for k, vs in out.items()}
+
+    def concurrent():
+        Term.cache_clear()
+        service.max_workers = max_workers
+        term = Term(subject)
+        return term(*preds, asTerm=True)
+
+    try:
+        assert sequential() == concurrent()
+        return {'sequential': timeper(sequential, 1),
+                'concurrent': timeper(concurrent, 1)}
+    finally:
+        if query is not None:
+            Term.query = query
+
+
+BENCHMARKS = {
+    'qname': bench_qname,
+    'ontid': bench_ontid,
+    'identifier_prefixes': bench_identifier_prefixes,
+    'split_uri': bench_split_uri,
+    'namespace_index': bench_namespace_index,
+    'registration': bench_registration,
+    'snapshot': bench_snapshot,
+    'many': bench_many,
+    'ontid_curie_accessor': bench_ontid_curie,
+    'threads': bench_threads,
+    'intern': bench_intern,
+    'memory': bench_memory,
+    'normalize_predicates': bench_normalize_predicates,
+    'identifier_sets': bench_identifier_sets,
+    'repr': bench_repr,
+    'term_cache': bench_term_cache,
+    'bulk_fetch': bench_bulk_fetch,
+    'search': bench_search,
+    'predicates': bench_predicates,
+}
+
+# smaller inputs for smoke testing the suite
+QUICK = {
+    'qname': dict(count=200),
+    'ontid': dict(count=100),
+    'identifier_prefixes': dict(count=100),
+    'split_uri': dict(count=200),
+    'namespace_index': dict(sizes=(100,), lookups=100),
+    'registration': dict(sizes=(100,)),
+    'snapshot': dict(size=100),
+    'many': dict(size=100, items=1000, distinct=100),
+    'ontid_curie_accessor': dict(number=100),
+    'threads': dict(threads=(1, 2), size=100, items=500),
+    'intern': dict(edges=1000, nodes=100),
+    'memory': dict(count=200),
+    'normalize_predicates': dict(objects=50),
+    'identifier_sets': dict(count=1000),
+    'repr': dict(count=200),
+    'term_cache': dict(count=50),
+    'bulk_fetch': dict(count=20, latency=0),
+    'search': dict(count=100, hits=5, latency=0),
+    'predicates': dict(predicates=4, objects=3, latency=0),
+}
+
+
+def run(names=None, quick=False):
+    """ run benchmarks by name, all of them by default """
+    names = list(BENCHMARKS) if not names else names
+    bads = [name for name in names if name not in BENCHMARKS]
+    if bads:
+        raise ValueError(f'unknown benchmarks {bads}')
+
+    results = {}
+    for name in names:
+        kwargs = QUICK[name] if quick else {}
+        results[name] = BENCHMARKS[name](**kwargs)
+
+    return {'meta': {'ontquery': oq.__version__,
+                     'python': platform.python_version(),
+                     'implementation': platform.python_implementation(),
+                     'machine': platform.machine(),
+                     'quick': quick},
+            'results': json.loads(json.dumps(results))}  # normalize keys to str
+
+
+def flatten(results, path=()):
+    for key, value in results.items():
+        if isinstance(value, dict):
+            yield from flatten(value, path + (key,))
+        else:
+            yield '.'.join(path + (key,)), value
+
+
+def compare(old, new):
+    """ ratio of new to old for every result present in both runs """
+    old = dict(flatten(old['results']))
+    return {key: value / old[key] for key, value in flatten(new['results'])
+            if old.get(key)}
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('names', nargs='*', help=f'any of {", ".join(BENCHMARKS)}')
+    parser.add_argument('--json', help='write results to this path')
+    parser.add_argument('--compare', help='results from a previous --json run')
+    parser.add_argument('--quick', action='store_true', help='small inputs, for smoke testing')
+    args = parser.parse_args(argv)
+
+    out = run(args.names, quick=args.quick)
+    for key, value in flatten(out['results']):
+        print(f'{key:<60} {value:.4g}')
+
+    if args.json:
+        with open(args.json, 'wt') as f:
+            json.dump(out, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, 'rt') as f:
+            old = json.load(f)
+
+        print('\nnew / old, threads are calls per second so higher is better')
+        for key, ratio in compare(old, out).items():
+            print(f'{key:<60} {ratio:.2f}')
+
+
+if __name__ == '__main__':
+    main()
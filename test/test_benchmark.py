@@ -0,0 +1,13 @@
+import json
+import unittest
+from . import benchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_quick(self):
+        out = benchmark.run(quick=True)
+        assert set(out['results']) == set(benchmark.BENCHMARKS)
+        assert json.loads(json.dumps(out)) == out
+        assert all(v >= 0 for k, v in benchmark.flatten(out['results']))
+        ratios = benchmark.compare(out, out)
+        assert ratios and all(r == 1 for r in ratios.values())
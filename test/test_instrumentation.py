@@ -0,0 +1,51 @@
+import sys
+import tracemalloc
+import unittest
+import ontquery as oq
+from ontquery import instrumentation
+from test import common
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        remote = oq.plugin.get('rdflib')(common.test_graph)
+        oq.OntTerm.query_init(remote)
+
+    def test_report(self):
+        before = instrumentation.report()['instances']
+        ids = [oq.OntId(f'UBERON:{i:0>7}') for i in range(100)]
+        terms = [oq.OntTerm('UBERON:0000955'), oq.OntTerm('BIRNLEX:796')]
+        out = instrumentation.report()
+        after = out['instances']
+        assert after['OntId']['count'] - before['OntId']['count'] >= len(ids)
+        assert after['OntTerm']['count'] - before['OntTerm']['count'] >= len(terms)
+        assert after['QueryResult']['count'] >= len(terms)
+        assert after['OntId']['bytes'] > 0 and after['OntTerm']['bytes'] > 0
+        caches = out['caches']
+        assert caches['OntCuries']['prefixes'] == len(oq.OntCuries._dict)
+        assert caches['OntTerm._cache']['entries'] == len(oq.OntTerm._cache) > 0
+        assert caches['OntTerm._cache']['bytes'] > 0
+
+    def test_sizeof(self):
+        oid = oq.OntId('UBERON:0000955')
+        seen = set()
+        size = instrumentation.sizeof(oid, seen)
+        assert size > len(oid)
+        assert instrumentation.sizeof(oid, seen) == 0, 'counted twice'
+        pair = [oid, oid]
+        assert instrumentation.sizeof(pair) == sys.getsizeof(pair) + size
+
+    def test_snapshot(self):
+        tracing = tracemalloc.is_tracing()
+        instrumentation.start()
+        try:
+            old = instrumentation.snapshot()
+            ids = [oq.OntId(f'BIRNLEX:{i}') for i in range(100)]
+            new = instrumentation.snapshot()
+            stats = instrumentation.diff(old, new)
+            assert stats and stats[0].size_diff > 0
+            assert all(t.traceback[0].filename.startswith(instrumentation._package_dir)
+                       for t in new.traces)
+        finally:
+            if not tracing:
+                instrumentation.stop()
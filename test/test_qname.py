@@ -1,3 +1,4 @@
+import threading
 import unittest
 from . import common
 import ontquery as oq
@@ -36,6 +37,81 @@ class TestOntCuries(unittest.TestCase):
 
         assert hit
 
+    def test_legacy_subclass(self):
+        # the pattern used to get an independent mapping before new existed
+        class Legacy(oq.OntCuries):
+            _dict = {}
+            _n_to_p = {}
+            _strie = {}
+            _trie = {}
+
+        iri = 'http://legacy.example.org/1'
+        before = oq.OntCuries.qname(iri)
+        Legacy({'b': 'http://legacy.example.org/'})
+        assert Legacy.qname(iri) == 'b:1'
+        assert oq.OntCuries.qname(iri) == before
+        assert 'b' not in oq.OntCuries()
+        assert 'b' in Legacy.mapping and 'b' not in oq.OntCuries.mapping
+
+        Preset = type('Preset', (oq.OntCuries,),
+                      dict(_dict={'a': 'http://a.org/'}, _n_to_p={}, _strie={}, _trie={}))
+        assert Preset.qname('http://a.org/1') == 'a:1'
+        assert 'a' not in oq.OntCuries.mapping
+
+    def test_read_only(self):
+        with self.assertRaises(TypeError):
+            self.OntCuries._dict['lol'] = 'http://lol.com/'
+
+        with self.assertRaises(TypeError):
+            self.OntCuries._n_to_p['http://lol.com/'] = 'lol'
+
+        with self.assertRaises(TypeError):
+            self.OntCuries({})['lol'] = 'http://lol.com/'
+
+        self.OntCuries._trie.add('http://lol.com/')
+        assert 'http://lol.com/' not in self.OntCuries.freeze()._trie
+
+    def test_reset(self):
+        iri = common.CURIE_MAP['BIRNLEX'] + '796'
+        self.OntCuries.reset()
+        assert not len(self.OntCuries) and self.OntCuries.qname(iri) == iri
+        self.OntCuries(common.CURIE_MAP)
+        assert self.OntCuries.qname(iri) == 'BIRNLEX:796'
+
+    def test_identifier_prefixes_invalidate(self):
+        iri = self.OntCuries['isAbout'] + 'lol'
+        before = self.OntCuries.identifier_prefixes(iri)
+        assert self.OntCuries._identifier_index() is self.OntCuries._identifier_index()
+        self.OntCuries({'isAboutLol': iri})
+        after = self.OntCuries.identifier_prefixes(iri)
+        assert after == before + ['isAboutLol'], after
+        assert self.OntCuries.identifier_prefixes('http://lol.com/unknown') == []
+
+    def test_mapping(self):
+        mapping = self.OntCuries.mapping
+        assert mapping is self.OntCuries.mapping
+        assert dict(mapping) == common.CURIE_MAP
+        assert 'BIRNLEX' in self.OntCuries and 'notaprefix' not in self.OntCuries
+        self.OntCuries({'lol': 'http://lol.com/'})
+        # views are of a snapshot, the new prefix is in the next one
+        assert 'lol' not in mapping
+        assert self.OntCuries.mapping['lol'] == 'http://lol.com/'
+        try:
+            self.OntCuries.mapping['lol'] = 'http://other.com/'
+            raise AssertionError('should have failed')
+        except TypeError:
+            pass
+
+    def test_bulk_matches_incremental(self):
+        incremental = oq.OntCuries.new()
+        for prefix, namespace in common.CURIE_MAP.items():
+            incremental({prefix: namespace})
+
+        assert incremental._dict == self.OntCuries._dict
+        assert incremental._n_to_p == self.OntCuries._n_to_p
+        assert incremental._trie._lengths == self.OntCuries._trie._lengths
+        assert list(incremental._trie) == list(self.OntCuries._trie)
+
 
 class TestQname(unittest.TestCase):
     suffixes = common.suffixes
@@ -85,3 +161,178 @@ class TestQname(unittest.TestCase):
         got = oq.OntCuries.qname(iri)
         old = oq.OntCuries._qname_old(iri)
         return expect, got, old
+
+
+class TestQnameCache(unittest.TestCase):
+    def setUp(self):
+        self.OntCuries = oq.OntCuries.new()
+        self.OntCuries({'a': 'http://a.org/', 'b': 'http://b.org/b_'})
+
+    def test_hit_miss(self):
+        iri = 'http://a.org/1'
+        before = self.OntCuries.qname_cache_info()
+        assert self.OntCuries.qname(iri) == 'a:1'
+        assert self.OntCuries.qname(iri) == 'a:1'
+        after = self.OntCuries.qname_cache_info()
+        assert after.misses - before.misses == 1, after
+        assert after.hits - before.hits == 1, after
+
+    def test_invalidate_on_new_prefix(self):
+        iri = 'http://a.org/c_1'
+        assert self.OntCuries.qname(iri) == 'a:c_1'
+        generation = self.OntCuries.qname_cache_info().generation
+        self.OntCuries({'c': 'http://a.org/c_'})
+        assert self.OntCuries.qname_cache_info().generation > generation
+        assert self.OntCuries.qname(iri) == 'c:1'
+
+    def test_no_invalidate_on_same_prefix(self):
+        self.OntCuries.qname('http://a.org/1')
+        info = self.OntCuries.qname_cache_info()
+        self.OntCuries({'a': 'http://a.org/'})
+        assert self.OntCuries.qname_cache_info() == info
+
+    def test_subclass_shares_memo(self):
+        LocalCuries = type('LocalCuries', (self.OntCuries,), {})
+        assert LocalCuries.qname('http://b.org/b_1') == 'b:1'
+        LocalCuries({'d': 'http://b.org/b_d'})
+        assert self.OntCuries.qname('http://b.org/b_d1') == 'd:1'
+
+    def test_new_is_isolated(self):
+        Other = oq.OntCuries.new()
+        Other({'a': 'http://other.org/'})
+        assert self.OntCuries.qname('http://a.org/1') == 'a:1'
+        assert Other.qname('http://a.org/1') == 'http://a.org/1'
+
+    def test_unsplitable_type(self):
+        class S(str): pass
+        iri = S('http://')
+        assert self.OntCuries.qname(iri) is iri
+        assert self.OntCuries.qname(iri) is iri
+
+
+class TestMany(unittest.TestCase):
+    def setUp(self):
+        self.OntCuries = oq.OntCuries.new()
+        self.OntCuries(common.CURIE_MAP)
+
+    def test_qname_many(self):
+        iris = [namespace + suffix
+                for namespace in common.CURIE_MAP.values()
+                for suffix in common.suffixes] * 2
+        assert self.OntCuries.qname_many(iris) == [self.OntCuries.qname(i) for i in iris]
+
+    def test_expand_many(self):
+        curies = [prefix + ':' + suffix
+                  for prefix in common.CURIE_MAP
+                  for suffix in common.suffixes]
+        expect = [self.OntCuries[c.split(':', 1)[0]] + c.split(':', 1)[1] for c in curies]
+        assert self.OntCuries.expand_many(curies) == expect
+        assert self.OntCuries.expand_many(iter(curies)) == expect
+
+    def test_expand_many_bad(self):
+        curies = ['BIRNLEX:796', 'notaprefix:1', 'nocolon']
+        try:
+            self.OntCuries.expand_many(curies)
+            raise AssertionError('should have failed')
+        except KeyError:
+            pass
+
+        try:
+            self.OntCuries.expand_many(curies[-1:])
+            raise AssertionError('should have failed')
+        except ValueError:
+            pass
+
+        got = self.OntCuries.expand_many(curies, strict=False)
+        assert got[0] == self.OntCuries['BIRNLEX'] + '796'
+        assert got[1:] == [None, None]
+
+
+class TestFrozen(unittest.TestCase):
+    def setUp(self):
+        self.OntCuries = oq.OntCuries.new()
+        self.OntCuries(common.CURIE_MAP)
+
+    def test_roundtrip(self):
+        import os
+        import tempfile
+        frozen = self.OntCuries.freeze()
+        fd, path = tempfile.mkstemp(suffix='.pickle')
+        os.close(fd)
+        try:
+            frozen.dump(path)
+            Loaded = oq.OntCuries.new()
+            Loaded.load_snapshot(path)
+        finally:
+            os.remove(path)
+
+        assert Loaded._dict == self.OntCuries._dict
+        assert Loaded._n_to_p == self.OntCuries._n_to_p
+        for namespace in common.CURIE_MAP.values():
+            for suffix in common.suffixes:
+                iri = namespace + suffix
+                assert Loaded.qname(iri) == self.OntCuries.qname(iri)
+
+    def test_immutable(self):
+        frozen = self.OntCuries.freeze()
+        try:
+            frozen._dict = {}
+            raise AssertionError('should have failed')
+        except oq.exceptions.ReadOnlyError:
+            pass
+
+        self.OntCuries({'lol': 'http://lol.com/'})
+        assert 'lol' not in frozen
+
+    def test_load_frozen_merges(self):
+        Other = oq.OntCuries.new()
+        Other({'lol': 'http://lol.com/'})
+        Other.load_snapshot(self.OntCuries.freeze())
+        assert Other.qname('http://lol.com/1') == 'lol:1'
+        assert Other.qname(common.CURIE_MAP['BIRNLEX'] + '796') == 'BIRNLEX:796'
+
+
+class TestThreads(unittest.TestCase):
+    def setUp(self):
+        self.OntCuries = oq.OntCuries.new()
+        self.OntCuries(common.CURIE_MAP)
+
+    def test_readers_and_writers(self):
+        iris = [namespace + suffix
+                for namespace in common.CURIE_MAP.values()
+                for suffix in common.suffixes]
+        expect = self.OntCuries.qname_many(iris)
+        curies = list(expect)
+        expanded = self.OntCuries.expand_many(curies)
+        errors = []
+        nwriters, nprefixes = 4, 200
+
+        def read():
+            try:
+                for _ in range(20):
+                    assert [self.OntCuries.qname(i) for i in iris] == expect
+                    assert self.OntCuries.expand_many(curies) == expanded
+            except BaseException as e:
+                errors.append(e)
+
+        def write(n):
+            try:
+                for i in range(nprefixes):
+                    self.OntCuries({f'w{n}p{i}': f'http://writer{n}.org/{i}/'})
+            except BaseException as e:
+                errors.append(e)
+
+        threads = ([threading.Thread(target=read) for _ in range(4)] +
+                   [threading.Thread(target=write, args=(n,)) for n in range(nwriters)])
+        for thread in threads:
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+        assert not errors, errors
+        for n in range(nwriters):
+            for i in range(nprefixes):
+                assert self.OntCuries.qname(f'http://writer{n}.org/{i}/x') == f'w{n}p{i}:x'
+
+        assert len(self.OntCuries) == len(common.CURIE_MAP) + nwriters * nprefixes
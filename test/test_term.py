@@ -1,5 +1,9 @@
+import gc
+import weakref
 import copy
+import threading
 import unittest
+import rdflib
 from test import common
 
 import ontquery as oq
@@ -36,6 +40,41 @@ class TestOntId(unittest.TestCase):
         got = cls.class_to_test(curie=expect, iri=iri)
         return expect, got
 
+    def test_fast_path(self):
+        # the single argument fast path must agree with the general path
+        for prefix, namespace in common.CURIE_MAP.items():
+            for suffix in self.suffixes:
+                curie, iri = prefix + ':' + suffix, namespace + suffix
+                try:
+                    expect = oq.OntId(curie=curie)
+                except oq.OntId.Error as e:
+                    self.assertRaises(e.__class__, oq.OntId, curie)
+                    continue
+
+                for got in (oq.OntId(curie), oq.OntId(curie), oq.OntId(iri)):
+                    assert (got.iri, got.prefix, got.suffix) == (
+                        expect.iri, expect.prefix, expect.suffix), (got, expect)
+
+        self.assertRaises(oq.OntId.BadCurieError, oq.OntId, 'nocolon')
+        self.assertRaises(oq.OntId.UnknownPrefixError, oq.OntId, 'notaprefix:1')
+        self.assertRaises(oq.OntId.BadCurieError, oq.OntId, 'UBERON:0000 955')
+
+    def test_from_many(self):
+        good = ['UBERON:0000955', 'http://purl.obolibrary.org/obo/UBERON_0000955',
+                oq.OntId('BIRNLEX:796'), 'UBERON:0000955']
+        bad = ['nocolon', 'notaprefix:1', None]
+        expect = [oq.OntId(g) for g in good]
+        assert oq.OntId.from_many(good) == expect
+        assert list(oq.OntId.from_many(iter(good), generate=True)) == expect
+        assert [o.curie for o in oq.OntId.from_many(good)] == [o.curie for o in expect]
+        self.assertRaises(oq.OntId.BadCurieError, oq.OntId.from_many, bad)
+        assert oq.OntId.from_many(bad + good, errors='skip') == expect
+        marked = oq.OntId.from_many(good + bad, errors='mark')
+        assert marked[:len(good)] == expect
+        assert [type(m) for m in marked[len(good):]] == [
+            oq.OntId.BadCurieError, oq.OntId.UnknownPrefixError, TypeError]
+        self.assertRaises(ValueError, oq.OntId.from_many, good, errors='lol')
+
     def test_copy(self):
         for oid in self.terms_to_test:
             noid = copy.copy(oid)
@@ -58,6 +97,122 @@ class TestOntTerm(TestOntId):
         self.class_to_test.query_init(remote)
         super().setUp()
 
+    def test_eq_hash(self):
+        oid = oq.OntId('UBERON:0000955')
+        ot = self.class_to_test('UBERON:0000955')
+        values = (oid, ot, oid.iri, rdflib.URIRef(oid.iri), None, 1,
+                  oq.OntId('BIRNLEX:796'), self.class_to_test('BIRNLEX:796'))
+        for a in (oid, ot):
+            for b in values:
+                assert (a == b) == oq.terms.Identifier.__eq__(a, b), (a, b)
+                assert (a != b) != (a == b)
+
+        assert hash(oid) == hash(oq.OntId(oid.iri))
+        assert len({oid, oq.OntId(oid.iri), ot, self.class_to_test(oid.iri)}) == 2
+
+    def test_repr(self):
+        terms = (self.class_to_test('UBERON:0000955'), oq.OntId('UBERON:0000955'),
+                 self.class_to_test('BIRNLEX:796'))
+        for term in terms:
+            for args in term.repr_arg_order:
+                term.set_next_repr(*args)
+                legacy = term._repr_base.format(**term._repr_args)
+                assert repr(term) == legacy, (repr(term), legacy)
+
+    def test_repr_threads(self):
+        cls = self.class_to_test
+        default = cls.repr_args
+        current = cls._current_repr_args()
+        term = cls('UBERON:0000955')
+        arg_order = term.repr_arg_order
+        expected = []
+        for args in arg_order:
+            term.set_next_repr(*args)
+            expected.append(repr(term))
+
+        nthreads = 8
+        barrier = threading.Barrier(nthreads, timeout=10)
+        failed = []
+        def work(i):
+            args = arg_order[i % len(arg_order)]
+            expect = expected[i % len(arg_order)]
+            barrier.wait()
+            for _ in range(200):
+                term.set_next_repr(*args)
+                if term._current_repr_args() != args:
+                    failed.append((i, term._current_repr_args(), args))
+                got = repr(term)
+                if got != expect:
+                    failed.append((i, got, expect))
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(nthreads)]
+        [t.start() for t in threads]
+        [t.join() for t in threads]
+        assert not failed, failed[:5]
+        assert cls.repr_args == default
+        assert cls._current_repr_args() == current
+
+    def test_repr_args_after_level(self):
+        cls = oq.OntTerm
+        default = cls.repr_args
+        try:
+            term = cls('UBERON:0000955')
+            cls.repr_level(verbose=False)
+            cls.set_repr_args('curie', 'label')
+            assert repr(term) == "OntTerm('UBERON:0000955', label='brain')"
+            with self.assertRaises(ValueError):
+                cls('UBERON:0000955', label='not brain')
+
+            # the failure only affects the next repr
+            repr(term)
+            assert repr(term) == "OntTerm('UBERON:0000955', label='brain')"
+        finally:
+            cls.set_repr_args(*default)
+
+    def test_cache(self):
+        cls = self.class_to_test
+        cls.cache_clear()
+        info = cls.cache_info()
+        ot = cls('UBERON:0000955')
+        assert ot.label == 'brain'
+        again = cls('UBERON:0000955')
+        assert again._query_result is ot._query_result
+        after = cls.cache_info()
+        assert after.hits == info.hits + 1 and after.misses == info.misses + 1
+        fresh = cls('UBERON:0000955', cache=False)
+        assert fresh._query_result is not ot._query_result
+        assert cls.cache_info().hits == after.hits
+        assert cls('UBERON:0000955')._query_result is fresh._query_result
+        with self.assertRaises(ValueError):
+            cls('UBERON:0000955', label='not brain')
+
+    def test_cache_lru_ttl(self):
+        now = [0]
+        cache = oq.utils.LRUCache(maxsize=2, ttl=10, timer=lambda: now[0])
+        cache.add('a', 1)
+        cache.add('b', 2)
+        assert cache.get('a') == 1
+        cache.add('c', 3)
+        assert 'b' not in cache and cache.get('a') == 1 and cache.get('c') == 3
+        now[0] = 10
+        assert cache.get('a') is None
+        info = cache.info()
+        assert info.expired == 1 and info.hits == 3 and info.misses == 1
+        cache.configure(0, None)
+        cache.add('d', 4)
+        assert not len(cache)
+
+    def test_result_fields(self):
+        ot = self.class_to_test('UBERON:0000955')
+        result = ot._query_result
+        assert ot.label == result.label and ot.synonyms == result.synonyms
+        assert 'label' not in ot.__dict__, 'fields should not be stored twice'
+        ot.label = 'lol'
+        assert ot.label == 'lol' and result.label != 'lol'
+        ot._bind_query_result(result)
+        assert ot.label == result.label
+        assert dict(result.items()) == {k: result[k] for k in result}
+
     def test_copy_preds(self):
         ot = self.class_to_test('UBERON:0000955')
         ot(None)
@@ -66,6 +221,100 @@ class TestOntTerm(TestOntId):
         assert newot.predicates == ot.predicates
 
 
+class TestInterning(unittest.TestCase):
+    def setUp(self):
+        remote = oq.plugin.get('rdflib')(common.test_graph)
+        oq.OntTerm.query_init(remote)
+        oq.OntId.set_interning()
+
+    def tearDown(self):
+        oq.OntId.set_interning(False)
+        oq.OntTerm.set_interning(False)
+
+    def test_ontid(self):
+        oid = oq.OntId('UBERON:0000955')
+        assert oq.OntId(oid.iri) is oid
+        assert oq.OntId(prefix='UBERON', suffix='0000955') is oid
+        assert oq.OntId(curie='UBERON:0000955') is oid
+        assert copy.copy(oid) is oid and copy.deepcopy(oid) is oid
+        assert oq.OntTerm(oid) is not oid, 'classes must not share instances'
+
+    def test_weak(self):
+        iri = oq.OntId('UBERON:0000955').iri
+        gc.collect()
+        assert iri not in oq.OntId._interned()
+
+    def test_new_curies(self):
+        oid = oq.OntId('UBERON:0000955')
+        OntCuries = oq.OntCuries.new()
+        OntCuries(common.CURIE_MAP)
+        OntCuries({'UBERONintern': oid.iri})
+        oq.OntId._namespaces = OntCuries
+        try:
+            assert oq.OntId(oid.iri) is not oid
+            assert oq.OntId(oid.iri).curie == 'UBERONintern:'
+        finally:
+            oq.OntId._namespaces = oq.OntCuries
+
+    def test_per_class(self):
+        assert not oq.OntTerm._intern
+        assert oq.OntTerm('UBERON:0000955') is not oq.OntTerm('UBERON:0000955')
+
+    def test_inputs_not_held(self):
+        oq.OntTerm.set_interning()
+        oid = oq.OntId('UBERON:0000955')
+        ref = weakref.ref(oid)
+        class S(str): pass  # URIRef and friends, which cannot be weakly referenced
+        uriref = S(oid.iri)
+        uriref_ref = weakref.ref(uriref)
+        terms = [oid.asTerm(), oq.OntTerm(oid), oq.OntTerm(uriref),
+                 *oq.OntTerm.from_many([oid, uriref])]
+        assert oq.OntId(uriref) is oid and oq.OntId.from_many([uriref]) == [oid]
+        del oid, uriref
+        gc.collect()
+        assert ref() is None and uriref_ref() is None, 'memos must not hold inputs'
+
+    def test_ontterm(self):
+        oq.OntTerm.set_interning()
+        term = oq.OntTerm('UBERON:0000955')
+        assert term.label
+        assert oq.OntTerm(term.iri) is term
+        assert oq.OntTerm('UBERON:0000955', label=term.label) is term
+        assert oq.OntId(term) is not term
+
+
+class TestLazy(unittest.TestCase):
+    def setUp(self):
+        oq.OntId.set_lazy()
+
+    def tearDown(self):
+        oq.OntId.set_lazy(False)
+        oq.OntTerm.set_lazy(False)
+
+    def test_lazy(self):
+        iri = 'http://purl.obolibrary.org/obo/UBERON_0000955'
+        for value in (iri, 'UBERON:0000955'):
+            oid = oq.OntId(value)
+            assert oid == iri and not oid.__dict__
+            assert oid.curie == 'UBERON:0000955'
+            assert (oid.prefix, oid.suffix) == ('UBERON', '0000955')
+
+        assert oq.OntId.from_many([iri])[0].__dict__ == {}
+        self.assertRaises(oq.OntId.BadCurieError, oq.OntId, 'nocolon')
+        self.assertRaises(oq.OntId.UnknownPrefixError, oq.OntId, 'notaprefix:1')
+        self.assertRaises(AttributeError, getattr, oq.OntId(iri), 'lol')
+        assert oq.OntId('http://example.org/unknown/1').curie is None
+
+    def test_lazy_ontterm(self):
+        remote = oq.plugin.get('rdflib')(common.test_graph)
+        oq.OntTerm.query_init(remote)
+        assert not oq.OntTerm._lazy, 'subclasses must not inherit lazy'
+        assert oq.OntTerm('UBERON:0000955').__dict__.get('prefix') == 'UBERON'
+        oq.OntTerm.set_lazy()
+        assert oq.OntTerm('UBERON:0000955').label
+        assert oq.OntTerm.from_many(['UBERON:0000955'])[0].label
+
+
 class TestInterveningInstrumented(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
@@ -100,7 +349,129 @@ class TestInterveningInstrumented(unittest.TestCase):
         assert inst_class_a is self.OntTerm2, 'instrumented class from new uninstrumented class is not the originating instrumented class'
         assert inst_class_a is inst_class_b, 'instrumented classes differ between calls'
 
+    def test_class_cache(self):
+        cache = oq.terms.Identifier._class_cache
+        uninst = oq.OntTerm._uninstrumented_class()
+        assert cache[oq.OntTerm, False] is uninst
+        class Other(oq.terms.Identifier): pass
+        assert not cache, 'new subclasses must invalidate the cache'
+        assert oq.OntTerm._uninstrumented_class() is uninst
+
     def test_2(self):
         self.OntTerm1.query
         hrm = self.OntTerm1._uninstrumented_class()._instrumented_class()
         hrm.query
+
+
+class TestBulkFetch(unittest.TestCase):
+    def setUp(self):
+        rdflibLocal = oq.plugin.get('rdflib')
+
+        class Single(rdflibLocal):
+            batches = False
+            calls = 0
+            threads = set()
+
+            def query(self, *args, **kwargs):
+                type(self).calls += 1
+                type(self).threads.add(threading.get_ident())
+                yield from super().query(*args, **kwargs)
+
+        graph = rdflib.Graph()
+        for curie, label in (('UBERON:0000955', 'other brain'), ('UBERON:1', 'only here')):
+            s = rdflib.URIRef(oq.OntId(curie))
+            graph.add((s, rdflib.RDF.type, rdflib.OWL.Class))
+            graph.add((s, rdflib.RDFS.label, rdflib.Literal(label)))
+
+        self.Single = Single
+        self.query = oq.OntTerm.query_init(Single(graph), rdflibLocal(common.test_graph))
+        oq.OntTerm.cache_clear()
+        self.curies = 'UBERON:0000955', 'BIRNLEX:796', 'UBERON:1', 'UBERON:2', 'UBERON:0000955'
+
+    def tearDown(self):
+        oq.OntTerm.query_init(oq.plugin.get('rdflib')(common.test_graph))
+
+    def test_fetch_many(self):
+        terms = oq.OntTerm.fetch_many(self.curies)
+        # ranking is preserved, the first service wins
+        assert [t.label for t in terms] == ['other brain', 'Brain', 'only here', None, 'other brain']
+        assert [t.validated for t in terms] == [True, True, True, False, True]
+        assert self.Single.calls == 4, 'each iri should only be sent once'
+        oq.OntTerm.cache_clear()
+        single = [oq.OntTerm(c) for c in self.curies]
+        assert [t.label for t in single] == [t.label for t in terms]
+
+    def test_from_many_errors(self):
+        bad = oq.OntId('UBERON:1').iri
+        def query(service, *args, **kwargs):
+            if kwargs.get('iri') == bad:
+                raise ValueError('fails at bind time')
+
+            yield from ()
+
+        self.Single.query = query
+        curies = ['UBERON:0000955', 'UBERON:1']
+        self.assertRaises(ValueError, oq.OntTerm.from_many, curies)
+        assert [t.curie for t in oq.OntTerm.from_many(curies, errors='skip')] == curies[:1]
+        marked = oq.OntTerm.from_many(curies, errors='mark')
+        assert marked[0].validated and isinstance(marked[1], ValueError)
+
+    def test_fetch_with(self):
+        terms = oq.OntTerm.fetch_many(self.curies[:2])
+        calls = self.Single.calls
+        for term in terms:
+            term.fetch_with()
+
+        assert len(self.query._bulk) == 2 and self.Single.calls == calls
+        assert self.query.bulk_fetch() == terms
+        assert self.Single.calls == calls, 'should have come from the cache'
+        assert self.query.bulk_fetch() == []
+
+    def test_fetch(self):
+        term = oq.OntTerm('UBERON:0000955')
+        assert term.label == 'other brain'
+        term.fetch('rdflibLocal')
+        assert term.label == 'brain'
+        term.fetch()
+        assert term.label == 'other brain'
+        self.assertRaises(ValueError, term.fetch, 'Typo')
+        self.Single.query = lambda self, *args, **kwargs: iter(())
+        term.fetch(self.Single.__name__)
+        assert term.validated and term.label == 'other brain'
+        assert term.definition == term._query_result.definition
+
+    def test_deferred(self):
+        oq.OntTerm.set_deferred(batch_size=4)
+        try:
+            terms = [oq.OntTerm(c) for c in self.curies]
+            terms += oq.OntTerm.from_many(['BIRNLEX:796'])
+            assert self.Single.calls == 0
+            assert terms[0].curie == 'UBERON:0000955' and len(set(terms)) == 4
+            assert self.Single.calls == 0, 'iri, curie, and hash should not resolve'
+            dropped = oq.OntTerm('UBERON:3')
+            ref = weakref.ref(dropped)
+            del dropped
+            gc.collect()
+            assert ref() is None, 'deferred terms should not be kept alive'
+            copied = copy.copy(terms[1])
+            assert terms[0].label == 'other brain'
+            # the whole first batch of 4 is resolved
+            assert self.Single.calls == 4
+            assert [t.validated for t in terms[:4]] == [True, True, True, False]
+            assert '_batch' not in terms[0].__dict__
+            assert '_batch' in terms[4].__dict__
+            assert terms[4].synonyms == terms[0].synonyms
+            assert terms[5].predicates and '_batch' not in terms[5].__dict__
+            assert copied.label == 'Brain'
+            assert self.Single.calls == 4, 'the same iris should come from the cache'
+            assert oq.OntTerm('UBERON:0000955', label='other brain').validated
+        finally:
+            oq.OntTerm.set_deferred(False)
+
+    def test_call_as_term(self):
+        term = oq.OntTerm('BIRNLEX:796')
+        out = term(None, asTerm=True, asPreferred=True)
+        assert out and all(isinstance(v, oq.OntTerm)
+                           for values in out.values() for v in values)
+        assert all(term.predicates[k] == v for k, v in out.items())
+        assert term('rdf:type') == tuple(v.asId() for v in out['rdf:type'])
@@ -0,0 +1,128 @@
+import random
+import unittest
+from unicodedata import category
+from ontquery import trie
+from . import common
+
+
+def reference_split_uri(uri, split_start=trie.SPLIT_START_CATEGORIES):
+    """ the original category scanning implementation of split_uri """
+    if uri.startswith(trie.XMLNS):
+        return (trie.XMLNS, uri.split(trie.XMLNS)[1])
+    length = len(uri)
+    for i in range(0, length):
+        c = uri[-i - 1]
+        if not category(c) in trie.NAME_CATEGORIES:
+            if c in trie.ALLOWED_NAME_CHARS:
+                continue
+            for j in range(-1 - i, length):
+                if category(uri[j]) in split_start or uri[j] == "_":
+                    ns = uri[:j]
+                    if not ns:
+                        break
+                    ln = uri[j:]
+                    return (ns, ln)
+            break
+    raise ValueError("Can't split '{}'".format(uri))
+
+
+def split_or_error(function, uri):
+    try:
+        return function(uri)
+    except ValueError:
+        return ValueError
+
+
+class TestNamespaceIndex(unittest.TestCase):
+    namespaces = sorted(set(common.CURIE_MAP.values()))
+
+    def setUp(self):
+        self.dict_trie = {}
+        for namespace in self.namespaces:
+            trie.insert_trie(self.dict_trie, namespace)
+
+        self.index = trie.NamespaceIndex(self.namespaces)
+
+    def values(self):
+        for namespace in self.namespaces:
+            for suffix in common.suffixes:
+                yield namespace + suffix
+                yield namespace[:-1] + suffix
+
+    def test_longest(self):
+        failed = []
+        for value in self.values():
+            expect = trie.get_longest_namespace(self.dict_trie, value)
+            got = self.index.longest(value)
+            if expect != got:
+                failed.append((value, expect, got))
+
+        assert not failed, failed
+
+    def test_namespaces(self):
+        failed = []
+        for value in self.values():
+            expect = list(trie.get_namespaces(self.dict_trie, value))
+            got = self.index.namespaces(value)
+            if expect != got:
+                failed.append((value, expect, got))
+
+        assert not failed, failed
+
+    def test_min_length(self):
+        index = trie.NamespaceIndex(['http://a.org/', 'http://a.org/b_'])
+        value = 'http://a.org/b_1'
+        assert index.longest(value, len('http://a.org/b_')) == 'http://a.org/b_'
+        assert index.longest(value, len('http://a.org/b_') + 1) is None
+        assert index.longest('http://a.org/c', len('http://a.org/')) == 'http://a.org/'
+
+    def test_add(self):
+        index = trie.NamespaceIndex()
+        for namespace in reversed(self.namespaces):
+            index.add(namespace)
+            index.add(namespace)
+
+        assert len(index) == len(self.index)
+        assert index._lengths == self.index._lengths
+        for value in self.values():
+            assert index.longest(value) == self.index.longest(value)
+
+
+class TestSplitUri(unittest.TestCase):
+    alphabet = ('abcXYZ019_-.:/#?=%&~ '
+                '\u00e9\u03bb\u00b7\u0387\u0301\u00bd\u2160\u30a2\u00aa')
+
+    def corpus(self):
+        for namespace in common.CURIE_MAP.values():
+            yield namespace
+            for suffix in common.suffixes:
+                yield namespace + suffix
+                yield namespace + suffix + '/'
+                yield namespace + '#' + suffix
+
+        yield trie.XMLNS + 'lang'
+        yield ''
+        yield '/x/'
+        yield '_'
+
+        rand = random.Random(0)
+        for _ in range(20000):
+            yield ''.join(rand.choice(self.alphabet)
+                          for _ in range(rand.randint(1, 24)))
+
+    def test_differential(self):
+        failed = []
+        for uri in self.corpus():
+            expect = split_or_error(reference_split_uri, uri)
+            got = split_or_error(trie.split_uri, uri)
+            if expect != got:
+                failed.append((uri, expect, got))
+
+        assert not failed, failed[:20]
+
+    def test_split_start(self):
+        split_start = trie.NAME_START_CATEGORIES
+        for uri in self.corpus():
+            expect = split_or_error(lambda u: reference_split_uri(u, split_start), uri)
+            got = split_or_error(lambda u: trie.split_uri(u, split_start), uri)
+            assert expect == got, (uri, expect, got)